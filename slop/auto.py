@@ -1,36 +1,27 @@
 from __future__ import annotations
 
+import functools
 import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from dotenv import load_dotenv
-from rich.console import Console
+from .config import get_config, load_env_file, missing_required_env
+from .utils import read_stripped_text, sanitize_title
 
-from .config import AppConfig, LLMProvider
-from .pipeline import generate_video_pipeline
-from .utils import sanitize_title
-from .youtube_uploader import YouTubeUploader, UploadMetadata
+if TYPE_CHECKING:
+    from rich.console import Console
 
 
-console = Console()
+@functools.cache
+def _console() -> Console:
+    """Shared rich Console, created (and rich.console imported) on first print."""
+    from rich.console import Console
+
+    return Console()
 
 
 def _validate_required_env() -> None:
-    missing = []
-    try:
-        cfg = AppConfig()
-        if cfg.llm_provider == LLMProvider.DEEPSEEK:
-            if not cfg.deepseek_api_key:
-                missing.append("DEEPSEEK_API_KEY")
-        else:
-            if not cfg.openai_api_key:
-                missing.append("OPENAI_API_KEY")
-    except Exception:
-        # If config loading fails, check env vars directly
-        if not os.getenv("OPENAI_API_KEY") and not os.getenv("DEEPSEEK_API_KEY"):
-            missing.append("OPENAI_API_KEY or DEEPSEEK_API_KEY")
-    if not os.getenv("ELEVENLABS_API_KEY"):
-        missing.append("ELEVENLABS_API_KEY")
+    missing = missing_required_env()
     if missing:
         raise RuntimeError(
             "Missing required env vars: "
@@ -41,42 +32,43 @@ def _validate_required_env() -> None:
 
 def generate_and_upload(
     output_dir: Path | str = "outputs",
-    credentials_dir: Path | str = Path.cwd(),
+    credentials_dir: Path | str | None = None,
     privacy_status: str = "private",
 ) -> str:
     """Generate a video and upload it to YouTube using sensible defaults.
 
     Respects env overrides and optional PROMPT provided via CI/manual workflow.
-    Returns the uploaded YouTube video ID.
+    credentials_dir defaults to the current directory. Returns the uploaded YouTube video ID.
     """
-    load_dotenv()
+    # The pipeline and Google client stacks are heavy; load them only when actually generating
+    from .pipeline import generate_video_pipeline
+    from .youtube_uploader import UploadMetadata, YouTubeUploader
+
+    load_env_file()
     _validate_required_env()
 
+    cwd = Path.cwd()
+    if credentials_dir is None:
+        credentials_dir = cwd
+
     # Auto-read default prompt if PROMPT is unset
     if not os.getenv("PROMPT"):
-        default_prompt_path = Path.cwd() / "prompt.txt"
-        if default_prompt_path.exists():
-            try:
-                content = default_prompt_path.read_text(encoding="utf-8").strip()
-                if content:
-                    os.environ["PROMPT"] = content
-            except Exception:
-                pass
+        content = read_stripped_text(cwd / "prompt.txt")
+        if content:
+            os.environ["PROMPT"] = content
 
     output_dir = Path(output_dir)
-    credentials_dir = Path(credentials_dir)
-
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Surface credentials dir to analytics/uploader
-    os.environ.setdefault("YOUTUBE_CREDENTIALS_DIR", str(credentials_dir))
+    os.environ.setdefault("YOUTUBE_CREDENTIALS_DIR", os.fspath(credentials_dir))
 
-    config = AppConfig()
+    config = get_config()
     result = generate_video_pipeline(config=config, output_dir=output_dir)
-    console.print(f"[green]Generated video: {result.video_path}")
+    _console().print(f"[green]Generated video: {result.video_path}")
 
     title = sanitize_title(result.topic)
-    uploader = YouTubeUploader(credentials_dir=credentials_dir)
+    uploader = YouTubeUploader(credentials_dir=Path(credentials_dir))
     metadata = UploadMetadata(
         title=title,
         description="",
@@ -84,8 +76,8 @@ def generate_and_upload(
         category_id="22",
         privacy_status=config.youtube_privacy_status,
     )
-    video_id = uploader.upload_video(video_path=Path(result.video_path), metadata=metadata)
-    console.print(f"[green]Uploaded to YouTube. Video ID: {video_id}")
+    video_id = uploader.upload_video(video_path=result.video_path, metadata=metadata)
+    _console().print(f"[green]Uploaded to YouTube. Video ID: {video_id}")
     return video_id
 
 
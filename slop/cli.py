@@ -1,63 +1,94 @@
 from __future__ import annotations
 
+import functools
+import json
 import os
+import stat
 from pathlib import Path
 import logging
 import sys
+import threading
 from datetime import datetime, timezone, timedelta
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
-from rich.console import Console
-from dotenv import load_dotenv
-from google_auth_oauthlib.flow import InstalledAppFlow
-
-from .config import AppConfig, LLMProvider
-from .pipeline import generate_video_pipeline
-from .pipeline import render_video_from_scenes
-from .utils import InsufficientOpenAIFundsError, sanitize_title
-from .youtube_monitor import check_for_new_video_and_get_transcript, YouTubePublicMonitor, parse_published_at_iso8601
-from .youtube_uploader import YouTubeUploader, UploadMetadata, YOUTUBE_UPLOAD_SCOPES
-from .drive_uploader import DriveUploader, DRIVE_SCOPES
-from .uploader_config import YouTubeUploadConfig, DriveUploadConfig
-from .scriptgen import generate_topic_and_scenes, Scene, Scenario
-
-
-console = Console()
+
+from .config import LLM_API_KEY_ENV, AppConfig, LLMProvider, get_config, load_env_file, missing_required_env
+from .utils import InsufficientOpenAIFundsError, read_stripped_text
+from .uploader_config import (
+    DriveUploadConfig,
+    YouTubeUploadConfig,
+    get_drive_upload_config,
+    get_youtube_upload_config,
+)
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from rich.console import Console
+
+    from .drive_uploader import DriveUploader
+    from .youtube_uploader import YouTubeUploader
+
+
 app = typer.Typer(help="slop - AI video generator", no_args_is_help=True)
 
 
+@functools.cache
+def _console() -> Console:
+    """Shared rich Console, created (and rich.console imported) on first print.
+
+    Auto-highlighting is off: status lines carry explicit markup, so the per-print
+    highlighter regex pass over IDs and paths is wasted work.
+    """
+    from rich.console import Console
+
+    return Console(highlight=False)
+
+
+@functools.cache
+def _plain_output() -> bool:
+    # CI logs and pipes get no colour from rich anyway; skip its markup/width handling there
+    return not sys.stdout.isatty()
+
+
+def _cprint(message: str) -> None:
+    """Print a status line: rich-rendered on a terminal, markup-stripped plain text otherwise."""
+    if _plain_output():
+        from rich.text import Text
+
+        sys.stdout.write(Text.from_markup(message).plain + "\n")
+    else:
+        _console().print(message)
+
+
+# Logging is configured once per process; later calls are a single flag check
+_LOG_HANDLER: Optional[logging.Handler] = None
+_LOGGING_CONFIGURED = False
+
+
 def _configure_logging() -> None:
+    global _LOG_HANDLER, _LOGGING_CONFIGURED
+    if _LOGGING_CONFIGURED:
+        return
     root = logging.getLogger()
     if not root.handlers:
-        handler = logging.StreamHandler(stream=sys.stdout)
-        formatter = logging.Formatter("%(asctime)s %(levelname)s %(name)s - %(message)s")
-        handler.setFormatter(formatter)
-        root.addHandler(handler)
+        if _LOG_HANDLER is None:
+            _LOG_HANDLER = logging.StreamHandler(stream=sys.stdout)
+            _LOG_HANDLER.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s - %(message)s"))
+        root.addHandler(_LOG_HANDLER)
     root.setLevel(logging.INFO)
+    _LOGGING_CONFIGURED = True
 
 
 def _ensure_env_loaded() -> None:
-    load_dotenv()
+    load_env_file()
     _configure_logging()
 
 
-def _validate_required_env() -> None:
-    missing = []
-    try:
-        cfg = AppConfig()
-        if cfg.llm_provider == LLMProvider.DEEPSEEK:
-            if not cfg.deepseek_api_key:
-                missing.append("DEEPSEEK_API_KEY")
-        else:
-            if not cfg.openai_api_key:
-                missing.append("OPENAI_API_KEY")
-    except Exception:
-        # If config loading fails, check env vars directly
-        if not os.getenv("OPENAI_API_KEY") and not os.getenv("DEEPSEEK_API_KEY"):
-            missing.append("OPENAI_API_KEY or DEEPSEEK_API_KEY")
-    if not os.getenv("ELEVENLABS_API_KEY"):
-        missing.append("ELEVENLABS_API_KEY")
+def _validate_required_env() -> AppConfig:
+    """Exit if required env vars are missing; otherwise return the process-wide AppConfig."""
+    missing = missing_required_env()
     if missing:
         typer.secho(
             "Missing required env vars: " + ", ".join(missing)
@@ -65,45 +96,99 @@ def _validate_required_env() -> None:
             fg=typer.colors.RED,
         )
         raise typer.Exit(code=1)
+    return get_config()
+
+
+def _require_env(*keys: str) -> None:
+    """Exit with an informative error if any of the given env vars is unset or empty."""
+    env = os.environ
+    missing = [key for key in keys if not env.get(key)]
+    if missing:
+        typer.secho(f"Missing required env var: {', '.join(missing)} (set in .env)", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+
+
+# Uploaders reused across commands run in one process, keyed by credentials dir and OAuth inputs
+_YOUTUBE_UPLOADERS: dict[tuple, YouTubeUploader] = {}
+_DRIVE_UPLOADERS: dict[tuple, DriveUploader] = {}
+
+
+def _get_youtube_uploader(credentials_dir: Path, cfg: AppConfig | YouTubeUploadConfig) -> YouTubeUploader:
+    from .youtube_uploader import YouTubeUploader
+
+    key = (credentials_dir.resolve(), cfg.oauth_client_json, cfg.youtube_token_json)
+    uploader = _YOUTUBE_UPLOADERS.get(key)
+    if uploader is None:
+        uploader = _YOUTUBE_UPLOADERS[key] = YouTubeUploader(credentials_dir=credentials_dir, config=cfg)
+    return uploader
+
+
+def _get_drive_uploader(credentials_dir: Path, cfg: AppConfig | DriveUploadConfig) -> DriveUploader:
+    from .drive_uploader import DriveUploader
+
+    key = (credentials_dir.resolve(), cfg.oauth_client_json, cfg.drive_token_json)
+    uploader = _DRIVE_UPLOADERS.get(key)
+    if uploader is None:
+        uploader = _DRIVE_UPLOADERS[key] = DriveUploader(credentials_dir=credentials_dir, config=cfg)
+    return uploader
+
+
+# Videos up to this size go up in a single resumable request; larger ones in upload_chunk_mb chunks
+_SINGLE_REQUEST_UPLOAD_MAX_BYTES = 100 * 1024 * 1024
+
+
+def _upload_chunk_size(size_bytes: int, chunk_mb: int) -> int:
+    if size_bytes <= _SINGLE_REQUEST_UPLOAD_MAX_BYTES:
+        return -1
+    return chunk_mb * 1024 * 1024
+
+
+def _prewarm_credentials(credentials_dir: Path, cfg: AppConfig) -> threading.Thread:
+    """Load and, if expired, refresh YouTube and Drive credentials on a background thread.
+
+    Errors are ignored here; the upload steps raise the informative ones later.
+    """
+
+    def _warm() -> None:
+        for get_uploader in (_get_youtube_uploader, _get_drive_uploader):
+            try:
+                get_uploader(credentials_dir, cfg)._get_credentials()
+            except Exception:
+                pass
+
+    thread = threading.Thread(target=_warm, name="slop-credentials-prewarm", daemon=True)
+    thread.start()
+    return thread
 
 
 def _require_openai() -> AppConfig:
     """Load settings and ensure LLM API key is present (for scenes generation)."""
     try:
-        cfg = AppConfig()
+        cfg = get_config()
     except Exception:
         typer.secho("Missing required env var: OPENAI_API_KEY or DEEPSEEK_API_KEY (set in .env)", fg=typer.colors.RED)
         raise typer.Exit(code=1)
-    if cfg.llm_provider == LLMProvider.DEEPSEEK:
-        if not getattr(cfg, "deepseek_api_key", None):
-            typer.secho("Missing required env var: DEEPSEEK_API_KEY (set in .env)", fg=typer.colors.RED)
-            raise typer.Exit(code=1)
-    else:
-        if not getattr(cfg, "openai_api_key", None):
-            typer.secho("Missing required env var: OPENAI_API_KEY (set in .env)", fg=typer.colors.RED)
-            raise typer.Exit(code=1)
+    if not cfg.llm_api_key:
+        typer.secho(f"Missing required env var: {LLM_API_KEY_ENV[cfg.llm_provider]} (set in .env)", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
     return cfg
 
 
 def _require_openai_and_elevenlabs() -> AppConfig:
     """Load settings and ensure both LLM and ElevenLabs keys are present."""
     try:
-        cfg = AppConfig()
+        cfg = get_config()
     except Exception:
-        llm_key = "DEEPSEEK_API_KEY" if os.getenv("LLM_PROVIDER") == "deepseek" else "OPENAI_API_KEY"
+        llm_key = LLM_API_KEY_ENV.get(os.environ.get("LLM_PROVIDER"), LLM_API_KEY_ENV[LLMProvider.OPENAI])
         typer.secho(
             f"Missing required env vars: {llm_key} and ELEVENLABS_API_KEY (set in .env)",
             fg=typer.colors.RED,
         )
         raise typer.Exit(code=1)
     missing = []
-    if cfg.llm_provider == LLMProvider.DEEPSEEK:
-        if not getattr(cfg, "deepseek_api_key", None):
-            missing.append("DEEPSEEK_API_KEY")
-    else:
-        if not getattr(cfg, "openai_api_key", None):
-            missing.append("OPENAI_API_KEY")
-    if not getattr(cfg, "elevenlabs_api_key", None):
+    if not cfg.llm_api_key:
+        missing.append(LLM_API_KEY_ENV[cfg.llm_provider])
+    if not cfg.elevenlabs_api_key:
         missing.append("ELEVENLABS_API_KEY")
     if missing:
         typer.secho(
@@ -114,72 +199,106 @@ def _require_openai_and_elevenlabs() -> AppConfig:
     return cfg
 
 
+@functools.cache
+def _cwd() -> Path:
+    """Working directory of this CLI process (the CLI never chdirs), looked up once."""
+    return Path.cwd()
+
+
+def _credentials_path(credentials_dir: Optional[str]) -> Path:
+    """Resolve a --credentials-dir option; unset means the current directory."""
+    return Path(credentials_dir) if credentials_dir else _cwd()
+
+
 def _ensure_prompt_default() -> None:
-    if not os.getenv("PROMPT"):
-        default_prompt_path = Path.cwd() / "prompt.txt"
-        if default_prompt_path.exists():
-            try:
-                content = default_prompt_path.read_text(encoding="utf-8").strip()
-                if content:
-                    os.environ["PROMPT"] = content
-            except Exception:
-                pass
+    env = os.environ
+    if not env.get("PROMPT"):
+        content = read_stripped_text(_cwd() / "prompt.txt")
+        if content:
+            env["PROMPT"] = content
+
+
+def _default_youtube_credentials_dir() -> None:
+    """Point YOUTUBE_CREDENTIALS_DIR (read by the analytics step) at the cwd unless already set."""
+    env = os.environ
+    if "YOUTUBE_CREDENTIALS_DIR" not in env:
+        env["YOUTUBE_CREDENTIALS_DIR"] = str(_cwd())
 
 
 def _default_output_dir() -> Path:
     return Path("outputs")
 
 
+# Directories already created by this process; repeat calls skip the mkdir syscalls
+_ENSURED_DIRS: set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> Path:
+    if path not in _ENSURED_DIRS:
+        # Re-runs usually find the dir already there: one stat instead of a failing mkdir
+        if not os.path.isdir(path):
+            path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(path)
+    return path
+
+
+def _append_github_output(lines: list[str]) -> None:
+    """Append lines to the GitHub Actions output file, if any, with a single write (best-effort)."""
+    try:
+        github_output = os.environ.get("GITHUB_OUTPUT")
+        if github_output:
+            fd = os.open(github_output, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, "".join(f"{line}\n" for line in lines).encode("utf-8"))
+            finally:
+                os.close(fd)
+    except Exception:
+        pass
+
+
+def _emit_video_outputs(video_path: Path, output_dir: Path) -> None:
+    """Emit video_path/work_dir to GitHub Actions outputs if available."""
+    work_dir = output_dir / Path(video_path).stem
+    _append_github_output([f"video_path={video_path}", f"work_dir={work_dir}"])
+
+
 @app.command(name="generate")
 def generate() -> None:
     """Generate a video using defaults and ENV/PROMPT. No uploads here."""
+    from .pipeline import generate_video_pipeline
+
     _ensure_env_loaded()
-    _validate_required_env()
+    config = _validate_required_env()
     _ensure_prompt_default()
-    os.environ.setdefault("YOUTUBE_CREDENTIALS_DIR", str(Path.cwd()))
+    _default_youtube_credentials_dir()
 
-    output_dir = _default_output_dir()
-    output_dir.mkdir(parents=True, exist_ok=True)
+    output_dir = _ensure_dir(_default_output_dir())
 
-    config = AppConfig()
     try:
         result = generate_video_pipeline(config=config, output_dir=output_dir)
     except InsufficientOpenAIFundsError:
-        console.print("[red]OpenAI reports insufficient quota (429). Please check your OpenAI billing/funds: https://platform.openai.com/")
+        _cprint("[red]OpenAI reports insufficient quota (429). Please check your OpenAI billing/funds: https://platform.openai.com/")
         raise typer.Exit(code=3)
-    console.print(f"[green]Generated video: {result.video_path}")
-    # Emit GitHub Actions outputs if available
-    try:
-        github_output = os.getenv("GITHUB_OUTPUT")
-        if github_output:
-            basename = Path(result.video_path).stem
-            work_dir = output_dir / basename
-            with open(github_output, "a", encoding="utf-8") as fh:
-                fh.write(f"video_path={result.video_path}\n")
-                fh.write(f"work_dir={work_dir}\n")
-    except Exception:
-        pass
+    _cprint(f"[green]Generated video: {result.video_path}")
+    _emit_video_outputs(result.video_path, output_dir)
 
 
 @app.command(name="generate-scenes")
 def generate_scenes() -> None:
     """Generate only scenes JSON into ./scenes.json based on current prompt and settings."""
+    from .scriptgen import Scenario, generate_topic_and_scenes
+
     _ensure_env_loaded()
     cfg = _require_openai()
+    cwd = _cwd()
 
     # Build input text: prefer ./prompt.txt if present
-    input_text = ""
-    prompt_path = Path.cwd() / "prompt.txt"
-    if prompt_path.exists():
-        try:
-            input_text = prompt_path.read_text(encoding="utf-8").strip()
-        except Exception:
-            input_text = ""
+    input_text = read_stripped_text(cwd / "prompt.txt") or ""
 
-    os.environ.setdefault("YOUTUBE_CREDENTIALS_DIR", str(Path.cwd()))
+    _default_youtube_credentials_dir()
 
     num_scenes = max(1, cfg.num_images)
-    api_key = cfg.deepseek_api_key if cfg.llm_provider == LLMProvider.DEEPSEEK else cfg.openai_api_key
+    api_key = cfg.llm_api_key
     topic, scenes = generate_topic_and_scenes(
         input_text=input_text,
         target_duration_seconds=cfg.duration_seconds,
@@ -190,21 +309,24 @@ def generate_scenes() -> None:
         api_key=api_key,
     )
 
-    # Persist only scenes to repo root
-    scenario = {"scenes": [s.model_dump() for s in scenes]}
-    out_path = Path.cwd() / "scenes.json"
-    with open(out_path, "w", encoding="utf-8") as f:
-        import json as _json
-        _json.dump(scenario, f, ensure_ascii=False, indent=2)
-    console.print(f"[green]Wrote scenes to: {out_path}")
+    # Persist only scenes to repo root; pydantic serializes the whole scenario in one pass, written once
+    out_path = cwd / "scenes.json"
+    out_path.write_text(Scenario(scenes=scenes).model_dump_json(indent=2), encoding="utf-8")
+    _cprint(f"[green]Wrote scenes to: {out_path}")
 
 
 @app.command(name="render-from-scenes")
 def render_from_scenes() -> None:
     """Render a full video from ./scenes.json using current settings."""
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+
+    from .pipeline import render_video_from_scenes
+    from .scriptgen import Scenario
+
     _ensure_env_loaded()
 
-    scenes_path = Path.cwd() / "scenes.json"
+    scenes_path = _cwd() / "scenes.json"
     if not scenes_path.exists():
         typer.secho("scenes.json not found in repository root. Run 'slop generate-scenes' first.", fg=typer.colors.RED)
         raise typer.Exit(code=1)
@@ -212,8 +334,7 @@ def render_from_scenes() -> None:
     cfg = _require_openai_and_elevenlabs()
 
     try:
-        import json as _json
-        data = _json.loads(scenes_path.read_text(encoding="utf-8"))
+        data = json.loads(scenes_path.read_bytes())
     except Exception as e:
         typer.secho(f"Failed to read scenes.json: {e}", fg=typer.colors.RED)
         raise typer.Exit(code=2)
@@ -224,47 +345,85 @@ def render_from_scenes() -> None:
         typer.secho(f"Invalid scenes.json format: {e}", fg=typer.colors.RED)
         raise typer.Exit(code=3)
 
-    output_dir = _default_output_dir()
-    output_dir.mkdir(parents=True, exist_ok=True)
+    # After rendering we upload to Google Drive and YouTube; fail fast (before rendering) if misconfigured
+    resolved_parent = cfg.drive_parent_folder_id
+    if not resolved_parent:
+        typer.secho("Drive parent folder ID is required for Drive upload (set drive_parent_folder_id in .env).", fg=typer.colors.RED)
+        raise typer.Exit(code=4)
 
-    result = render_video_from_scenes(config=cfg, scenes=list(scenario.scenes), output_dir=output_dir, topic=None)
-    console.print(f"[green]Rendered video: {result.video_path}")
+    output_dir = _ensure_dir(_default_output_dir())
 
-    # After rendering, also upload to Google Drive and YouTube (fail fast if misconfigured)
-    video = Path(result.video_path)
-    basename = video.stem
-    work_dir = output_dir / basename
+    # This command has no --credentials-dir; OAuth files come from the default (working) directory
+    creds_path = _credentials_path(None)
+    # Token load/refresh overlaps with rendering instead of delaying the uploads
+    prewarm = _prewarm_credentials(creds_path, cfg)
 
-    # Upload to Google Drive (work directory + MP4)
-    try:
-        resolved_parent = getattr(cfg, "drive_parent_folder_id", None)
-        if not resolved_parent:
-            typer.secho("Drive parent folder ID is required for Drive upload (set drive_parent_folder_id in .env).", fg=typer.colors.RED)
-            raise typer.Exit(code=4)
-        drive = DriveUploader(credentials_dir=Path.cwd(), config=cfg)
-        folder_id = drive.upload_directory(work_dir, parent_folder_id=resolved_parent, make_shareable=True)
-        _ = drive.upload_file(video, parent_folder_id=folder_id, make_shareable=True)
-        console.print(f"[green]Uploaded to Google Drive. Folder ID: {folder_id}")
-    except typer.Exit:
-        raise
-    except Exception as e:
-        console.print(f"[red]Drive upload failed: {e}")
-        raise typer.Exit(code=5)
+    # The Drive folder only needs the basename, so create it while the video renders
+    folder_pool = ThreadPoolExecutor(max_workers=1)
+    folder_future: Optional[Future] = None
+
+    def precreate_drive_folder(name: str) -> None:
+        nonlocal folder_future
+
+        def create() -> str:
+            prewarm.join()
+            drive = _get_drive_uploader(creds_path, cfg)
+            return drive.create_folder(name, parent_folder_id=resolved_parent, make_shareable=False)
+
+        folder_future = folder_pool.submit(create)
 
-    # Upload to YouTube
     try:
-        # Derive title from work_dir/title.txt if present, else file stem
-        resolved_title = None
-        title_path = work_dir / "title.txt"
-        if title_path.exists():
+        result = render_video_from_scenes(
+            config=cfg,
+            scenes=list(scenario.scenes),
+            output_dir=output_dir,
+            topic=None,
+            on_basename=precreate_drive_folder,
+        )
+    except BaseException:
+        folder_pool.shutdown(wait=True)
+        # Nothing will be uploaded, so don't leave the pre-created folder empty on Drive
+        if folder_future is not None and folder_future.exception() is None:
             try:
-                resolved_title = title_path.read_text(encoding="utf-8").strip() or None
+                _get_drive_uploader(creds_path, cfg).delete_file(folder_future.result())
             except Exception:
-                resolved_title = None
-        if not resolved_title:
-            resolved_title = basename
+                pass
+        raise
+    folder_pool.shutdown(wait=True)
+    _cprint(f"[green]Rendered video: {result.video_path}")
+    prewarm.join()
+
+    video = Path(result.video_path)
+    basename = video.stem
+    work_dir = output_dir / basename
+
+    drive_folder_id: Optional[str] = None
+    if folder_future is not None:
+        try:
+            drive_folder_id = folder_future.result()
+        except Exception:
+            # upload_bundle creates the folder itself and reports any real Drive error
+            drive_folder_id = None
+
+    # Derive title from work_dir/title.txt if present, else file stem
+    resolved_title = read_stripped_text(work_dir / "title.txt") or basename
+
+    from .youtube_uploader import UploadMetadata
+
+    def drive_upload() -> str:
+        # Work directory + MP4
+        drive = _get_drive_uploader(creds_path, cfg)
+        return drive.upload_bundle(
+            work_dir,
+            extra_files=[video],
+            parent_folder_id=resolved_parent,
+            make_shareable=True,
+            max_concurrency=cfg.drive_upload_concurrency,
+            existing_folder_id=drive_folder_id,
+        )
 
-        uploader = YouTubeUploader(credentials_dir=Path.cwd(), config=cfg)
+    def youtube_upload() -> str:
+        uploader = _get_youtube_uploader(creds_path, cfg)
         metadata = UploadMetadata(
             title=resolved_title,
             description="",
@@ -272,45 +431,45 @@ def render_from_scenes() -> None:
             category_id="22",
             privacy_status=cfg.youtube_privacy_status,
         )
-        video_id = uploader.upload_video(video_path=video, metadata=metadata)
-        console.print(f"[green]Uploaded to YouTube. Video ID: {video_id}")
-    except Exception as e:
-        console.print(f"[red]YouTube upload failed: {e}")
+        chunk_size = _upload_chunk_size(video.stat().st_size, cfg.upload_chunk_mb)
+        return uploader.upload_video(video_path=video, metadata=metadata, chunk_size=chunk_size)
+
+    # Drive and YouTube uploads are independent; run them side by side
+    async def run_uploads():
+        return await asyncio.gather(
+            asyncio.to_thread(drive_upload),
+            asyncio.to_thread(youtube_upload),
+            return_exceptions=True,
+        )
+
+    drive_result, youtube_result = asyncio.run(run_uploads())
+    # Both status lines go out in one write
+    status_lines = [
+        f"[red]Drive upload failed: {drive_result}[/red]"
+        if isinstance(drive_result, Exception)
+        else f"[green]Uploaded to Google Drive. Folder ID: {drive_result}[/green]",
+        f"[red]YouTube upload failed: {youtube_result}[/red]"
+        if isinstance(youtube_result, Exception)
+        else f"[green]Uploaded to YouTube. Video ID: {youtube_result}[/green]",
+    ]
+    _cprint("\n".join(status_lines))
+    if isinstance(drive_result, Exception):
+        raise typer.Exit(code=5)
+    if isinstance(youtube_result, Exception):
         raise typer.Exit(code=6)
 
-    # Emit GitHub Actions outputs if available
-    try:
-        github_output = os.getenv("GITHUB_OUTPUT")
-        if github_output:
-            basename = Path(result.video_path).stem
-            work_dir = output_dir / basename
-            with open(github_output, "a", encoding="utf-8") as fh:
-                fh.write(f"video_path={result.video_path}\n")
-                fh.write(f"work_dir={work_dir}\n")
-    except Exception:
-        pass
+    _emit_video_outputs(result.video_path, output_dir)
 
 
-@app.command(name="auth-youtube")
-def auth_youtube(
-    credentials_dir: str = typer.Option(
-        str(Path.cwd()),
-        help="Directory to store OAuth credentials (client_secret.json, youtube_token.json)",
-    ),
-) -> None:
-    """Interactive OAuth flow to create/update YouTube token file."""
-    _ensure_env_loaded()
-    config = YouTubeUploadConfig()
-
-    cred_dir = Path(credentials_dir)
-    cred_dir.mkdir(parents=True, exist_ok=True)
+def _run_oauth_flow(credentials_dir: Optional[str], token_filename: str, scopes: list[str], oauth_client_json: Optional[str]) -> Path:
+    """Run the installed-app OAuth flow and save the token into credentials_dir; return the token path."""
+    cred_dir = _ensure_dir(_credentials_path(credentials_dir))
     client_secret_path = cred_dir / "client_secret.json"
-    token_path = cred_dir / "youtube_token.json"
+    token_path = cred_dir / token_filename
 
     if not client_secret_path.exists():
-        content = getattr(config, "oauth_client_json", None)
-        if content and content.strip().startswith("{"):
-            client_secret_path.write_text(content, encoding="utf-8")
+        if oauth_client_json and oauth_client_json.strip().startswith("{"):
+            client_secret_path.write_text(oauth_client_json, encoding="utf-8")
         else:
             typer.secho(
                 f"Missing client_secret.json at {client_secret_path}. Provide oauth_client_json in .env or place the file and retry.",
@@ -318,43 +477,44 @@ def auth_youtube(
             )
             raise typer.Exit(code=1)
 
-    flow = InstalledAppFlow.from_client_secrets_file(str(client_secret_path), scopes=YOUTUBE_UPLOAD_SCOPES)
+    from google_auth_oauthlib.flow import InstalledAppFlow
+
+    flow = InstalledAppFlow.from_client_secrets_file(str(client_secret_path), scopes=scopes)
     creds = flow.run_local_server(port=0)
     token_path.write_text(creds.to_json())
-    console.print(f"[green]Saved YouTube OAuth token to: {token_path}")
+    return token_path
 
 
-@app.command(name="auth-drive")
-def auth_drive(
-    credentials_dir: str = typer.Option(
-        str(Path.cwd()),
-        help="Directory to store OAuth credentials (client_secret.json, drive_token.json)",
+@app.command(name="auth-youtube")
+def auth_youtube(
+    credentials_dir: Optional[str] = typer.Option(
+        None,
+        help="Directory to store OAuth credentials (client_secret.json, youtube_token.json); defaults to the current directory",
     ),
 ) -> None:
-    """Interactive OAuth flow to create/update Google Drive token file."""
+    """Interactive OAuth flow to create/update YouTube token file."""
+    from .youtube_uploader import YOUTUBE_UPLOAD_SCOPES
+
     _ensure_env_loaded()
-    config = DriveUploadConfig()
+    config = get_youtube_upload_config()
+    token_path = _run_oauth_flow(credentials_dir, "youtube_token.json", YOUTUBE_UPLOAD_SCOPES, config.oauth_client_json)
+    _cprint(f"[green]Saved YouTube OAuth token to: {token_path}")
 
-    cred_dir = Path(credentials_dir)
-    cred_dir.mkdir(parents=True, exist_ok=True)
-    client_secret_path = cred_dir / "client_secret.json"
-    token_path = cred_dir / "drive_token.json"
 
-    if not client_secret_path.exists():
-        content = getattr(config, "oauth_client_json", None)
-        if content and content.strip().startswith("{"):
-            client_secret_path.write_text(content, encoding="utf-8")
-        else:
-            typer.secho(
-                f"Missing client_secret.json at {client_secret_path}. Provide oauth_client_json in .env or place the file and retry.",
-                fg=typer.colors.RED,
-            )
-            raise typer.Exit(code=1)
+@app.command(name="auth-drive")
+def auth_drive(
+    credentials_dir: Optional[str] = typer.Option(
+        None,
+        help="Directory to store OAuth credentials (client_secret.json, drive_token.json); defaults to the current directory",
+    ),
+) -> None:
+    """Interactive OAuth flow to create/update Google Drive token file."""
+    from .drive_uploader import DRIVE_SCOPES
 
-    flow = InstalledAppFlow.from_client_secrets_file(str(client_secret_path), scopes=DRIVE_SCOPES)
-    creds = flow.run_local_server(port=0)
-    token_path.write_text(creds.to_json())
-    console.print(f"[green]Saved Drive OAuth token to: {token_path}")
+    _ensure_env_loaded()
+    config = get_drive_upload_config()
+    token_path = _run_oauth_flow(credentials_dir, "drive_token.json", DRIVE_SCOPES, config.oauth_client_json)
+    _cprint(f"[green]Saved Drive OAuth token to: {token_path}")
 
 @app.command(name="upload-youtube")
 def upload_youtube(
@@ -362,33 +522,29 @@ def upload_youtube(
     title: Optional[str] = typer.Option(None, help="Video title. Defaults to file name"),
     description: str = typer.Option("", help="Video description"),
     privacy_status: Optional[str] = typer.Option(None, help="public | unlisted | private (defaults from config)"),
-    credentials_dir: str = typer.Option(
-        str(Path.cwd()),
-        help="Directory with OAuth creds (client_secret.json, youtube_token.json)",
+    credentials_dir: Optional[str] = typer.Option(
+        None,
+        help="Directory with OAuth creds (client_secret.json, youtube_token.json); defaults to the current directory",
     ),
 ) -> None:
     """Upload a video to YouTube. Independent of generation."""
+    from .youtube_uploader import UploadMetadata
+
     _ensure_env_loaded()
 
     video = Path(video_path)
-    if not video.exists():
+    try:
+        video_size = os.stat(video).st_size
+    except OSError:
         typer.secho(f"Video not found: {video}", fg=typer.colors.RED)
         raise typer.Exit(code=1)
 
-    cfg = YouTubeUploadConfig()
+    cfg = get_youtube_upload_config()
     # Derive title: CLI flag > title.txt in work dir > file stem
     resolved_title = title
     if not resolved_title:
-        work_dir = video.parent / video.stem
-        title_path = work_dir / "title.txt"
-        if title_path.exists():
-            try:
-                resolved_title = title_path.read_text(encoding="utf-8").strip() or None
-            except Exception:
-                resolved_title = None
-    if not resolved_title:
-        resolved_title = video.stem
-    uploader = YouTubeUploader(credentials_dir=Path(credentials_dir), config=cfg)
+        resolved_title = read_stripped_text(video.parent / video.stem / "title.txt") or video.stem
+    uploader = _get_youtube_uploader(_credentials_path(credentials_dir), cfg)
     metadata = UploadMetadata(
         title=resolved_title,
         description=description,
@@ -397,35 +553,87 @@ def upload_youtube(
         privacy_status=privacy_status or cfg.youtube_privacy_status,
     )
     try:
-        video_id = uploader.upload_video(video_path=video, metadata=metadata)
+        chunk_size = _upload_chunk_size(video_size, cfg.upload_chunk_mb)
+        video_id = uploader.upload_video(video_path=video, metadata=metadata, chunk_size=chunk_size)
     except Exception as e:
-        console.print(f"[red]YouTube upload failed: {e}")
+        _cprint(f"[red]YouTube upload failed: {e}")
+        raise typer.Exit(code=4)
+    _cprint(f"[green]Uploaded to YouTube. Video ID: {video_id}")
+
+
+@app.command(name="serve")
+def serve(
+    credentials_dir: Optional[str] = typer.Option(
+        None,
+        help="Directory with OAuth creds (client_secret.json, youtube_token.json); defaults to the current directory",
+    ),
+) -> None:
+    """Upload videos to YouTube from JSON lines on stdin, reusing one authenticated client.
+
+    Each line: {"video_path": "...", "metadata": {"title": ..., "description": ..., "tags": [...],
+    "category_id": "22", "privacy_status": ...}}. Metadata fields are optional.
+    """
+    from .youtube_uploader import UploadMetadata
+
+    _ensure_env_loaded()
+
+    cfg = get_youtube_upload_config()
+    uploader = _get_youtube_uploader(_credentials_path(credentials_dir), cfg)
+    failures = 0
+    for line_no, line in enumerate(sys.stdin, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            job = json.loads(line)
+            video = Path(job["video_path"])
+            meta = job.get("metadata") or {}
+            metadata = UploadMetadata(
+                title=meta.get("title") or video.stem,
+                description=meta.get("description", ""),
+                tags=meta.get("tags"),
+                category_id=str(meta.get("category_id", "22")),
+                privacy_status=meta.get("privacy_status") or cfg.youtube_privacy_status,
+            )
+            chunk_size = _upload_chunk_size(video.stat().st_size, cfg.upload_chunk_mb)
+            video_id = uploader.upload_video(video_path=video, metadata=metadata, chunk_size=chunk_size)
+        except Exception as e:
+            failures += 1
+            _cprint(f"[red]Job {line_no} failed: {e}")
+            continue
+        _cprint(f"[green]Uploaded to YouTube. Video ID: {video_id}")
+    if failures:
         raise typer.Exit(code=4)
-    console.print(f"[green]Uploaded to YouTube. Video ID: {video_id}")
 
 
 @app.command(name="upload-drive")
 def upload_drive(
     video_path: str = typer.Argument(..., help="Path to the MP4 file to upload alongside its work dir"),
     parent_folder_id: Optional[str] = typer.Option(None, help="Drive parent folder ID (defaults from config)"),
-    credentials_dir: str = typer.Option(
-        str(Path.cwd()),
-        help="Directory with OAuth creds (client_secret.json, drive_token.json)",
+    credentials_dir: Optional[str] = typer.Option(
+        None,
+        help="Directory with OAuth creds (client_secret.json, drive_token.json); defaults to the current directory",
     ),
 ) -> None:
     """Upload work directory and MP4 to Google Drive. Independent of generation."""
     _ensure_env_loaded()
 
     video = Path(video_path)
-    if not video.exists():
+    try:
+        os.stat(video)
+    except OSError:
         typer.secho(f"Video not found: {video}", fg=typer.colors.RED)
         raise typer.Exit(code=1)
 
-    cfg = DriveUploadConfig()
+    cfg = get_drive_upload_config()
     output_dir = video.parent
     basename = video.stem
     work_dir = output_dir / basename
-    if not work_dir.exists() or not work_dir.is_dir():
+    try:
+        work_dir_is_dir = stat.S_ISDIR(os.stat(work_dir).st_mode)
+    except OSError:
+        work_dir_is_dir = False
+    if not work_dir_is_dir:
         typer.secho(f"Work directory does not exist: {work_dir}", fg=typer.colors.RED)
         raise typer.Exit(code=2)
 
@@ -434,14 +642,19 @@ def upload_drive(
         typer.secho("Drive parent folder ID is required (provide flag or set in env).", fg=typer.colors.RED)
         raise typer.Exit(code=3)
 
-    drive = DriveUploader(credentials_dir=Path(credentials_dir), config=cfg)
+    drive = _get_drive_uploader(_credentials_path(credentials_dir), cfg)
     try:
-        folder_id = drive.upload_directory(work_dir, parent_folder_id=resolved_parent, make_shareable=True)
-        _ = drive.upload_file(video, parent_folder_id=folder_id, make_shareable=True)
+        folder_id = drive.upload_bundle(
+            work_dir,
+            extra_files=[video],
+            parent_folder_id=resolved_parent,
+            make_shareable=True,
+            max_concurrency=cfg.drive_upload_concurrency,
+        )
     except Exception as e:
-        console.print(f"[red]Drive upload failed: {e}")
+        _cprint(f"[red]Drive upload failed: {e}")
         raise typer.Exit(code=5)
-    console.print(f"[green]Uploaded to Google Drive. Folder ID: {folder_id}")
+    _cprint(f"[green]Uploaded to Google Drive. Folder ID: {folder_id}")
 
 
 @app.command(name="upload-artifacts")
@@ -451,81 +664,45 @@ def upload_artifacts(
     """Utility: emit artifact paths for CI (stdout and GITHUB_OUTPUT if present)."""
     _ensure_env_loaded()
     out_dir = Path(outputs_dir)
-    if not out_dir.exists():
+    # Collect mp4s (primary artifacts); scandir yields names and cached file types without Path objects
+    try:
+        with os.scandir(out_dir) as entries:
+            mp4s = sorted(entry.path for entry in entries if entry.name.endswith(".mp4") and entry.is_file())
+    except (FileNotFoundError, NotADirectoryError):
         typer.secho(f"Outputs directory not found: {out_dir}", fg=typer.colors.RED)
         raise typer.Exit(code=1)
-
-    # Collect mp4s (primary artifacts)
-    mp4s = sorted(out_dir.glob("*.mp4"))
     if not mp4s:
         typer.secho("No MP4 files found in outputs directory.", fg=typer.colors.RED)
         raise typer.Exit(code=2)
 
-    # Print newline-separated list for ease of consumption
-    for p in mp4s:
-        console.print(str(p))
+    # Print newline-separated list for ease of consumption; plain paths need no rich rendering
+    sys.stdout.write("".join(f"{p}\n" for p in mp4s))
+    sys.stdout.flush()
 
     # Also emit to GITHUB_OUTPUT for downstream steps
-    try:
-        github_output = os.getenv("GITHUB_OUTPUT")
-        if github_output:
-            with open(github_output, "a", encoding="utf-8") as fh:
-                fh.write("artifact_paths=\n")
-                for p in mp4s:
-                    fh.write(f"{p}\n")
-    except Exception:
-        pass
+    _append_github_output(["artifact_paths=", *mp4s])
 
 
 @app.command(name="generate-reaction")
 def generate_reaction() -> None:
     """Generate from latest transcript of a default channel; no uploads here."""
+    from .pipeline import generate_video_pipeline
+    from .youtube_monitor import parse_published_at_iso8601, scan_channel_for_transcript
+
     _ensure_env_loaded()
-    _validate_required_env()
-    if not os.getenv("RAPIDAPI_KEY"):
-        typer.secho("Missing required env var: RAPIDAPI_KEY (set in .env)", fg=typer.colors.RED)
-        raise typer.Exit(code=1)
+    config = _validate_required_env()
+    _require_env("RAPIDAPI_KEY")
 
-    os.environ.setdefault("YOUTUBE_CREDENTIALS_DIR", str(Path.cwd()))
+    credentials_path = _cwd()
+    _default_youtube_credentials_dir()
 
     # Defaults (no user-provided flags)
     channel_handle = "@SwaruuOficial"
     freshness_days = 1
     max_candidates = 5
 
-    credentials_path = Path.cwd()
-
-    # Optional search summary logging
     try:
-        monitor = YouTubePublicMonitor(credentials_dir=credentials_path)
-        channel_id = monitor.resolve_channel_id(channel_handle)
-        if channel_id:
-            videos = monitor.fetch_recent_videos(channel_id, max_results=max_candidates)
-            console.print(
-                f"[cyan]Search: channel_id={channel_id} | candidates={len(videos)} | freshness_window_days={freshness_days}"
-            )
-            if videos:
-                now = datetime.now(timezone.utc)
-                today_utc = now.date()
-                allowed_dates = { (today_utc - timedelta(days=offset)) for offset in range(1, max(1, freshness_days) + 1) }
-                console.print("[cyan]Last 5 uploads (title | published_at | fresh_yesterday):")
-                for idx, v in enumerate(videos, start=1):
-                    pub_dt = parse_published_at_iso8601(v.published_at)
-                    is_fresh = False
-                    pub_str = v.published_at
-                    if pub_dt:
-                        is_fresh = pub_dt.astimezone(timezone.utc).date() in allowed_dates
-                        pub_str = pub_dt.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M:%S %Z")
-                    console.print(f"  {idx}. {v.title} | {pub_str} | {is_fresh}")
-            else:
-                console.print("[yellow]No videos returned from API.")
-        else:
-            console.print("[yellow]Could not resolve channel id; continuing.")
-    except Exception as e:
-        console.print(f"[yellow]Failed to list recent videos for debugging: {e}")
-
-    try:
-        res = check_for_new_video_and_get_transcript(
+        scan = scan_channel_for_transcript(
             channel_handle_or_id=channel_handle,
             credentials_dir=credentials_path,
             preferred_languages=None,
@@ -534,32 +711,47 @@ def generate_reaction() -> None:
             use_generated_fallback=True,
         )
     except Exception as e:
-        console.print(f"[red]Failed to check channel for new videos: {e}")
+        _cprint(f"[red]Failed to check channel for new videos: {e}")
         raise typer.Exit(code=1)
 
-    if not res:
-        console.print("[red]No new video detected or no transcript available.")
+    # Search summary, derived from what the scan already fetched
+    videos = scan.candidates
+    if scan.channel_id:
+        _cprint(
+            f"[cyan]Search: channel_id={scan.channel_id} | candidates={len(videos)} | freshness_window_days={freshness_days}"
+        )
+        if videos:
+            now = datetime.now(timezone.utc)
+            today_utc = now.date()
+            allowed_dates = frozenset(today_utc - timedelta(days=offset) for offset in range(1, max(1, freshness_days) + 1))
+            lines = ["[cyan]Last 5 uploads (title | published_at | fresh_yesterday):[/cyan]"]
+            for idx, v in enumerate(videos, start=1):
+                pub_dt = parse_published_at_iso8601(v.published_at)
+                is_fresh = False
+                pub_str = v.published_at
+                if pub_dt:
+                    pub_utc = pub_dt.astimezone(timezone.utc)
+                    is_fresh = pub_utc.date() in allowed_dates
+                    pub_str = pub_utc.strftime("%Y-%m-%d %H:%M:%S %Z")
+                lines.append(f"  {idx}. {v.title} | {pub_str} | {is_fresh}")
+            # One render/write for the whole summary instead of one per video
+            _cprint("\n".join(lines))
+        else:
+            _cprint("[yellow]No videos returned from API.")
+    else:
+        _cprint("[yellow]Could not resolve channel id.")
+
+    if not scan.match:
+        _cprint("[red]No new video detected or no transcript available.")
         raise typer.Exit(code=2)
 
-    _, transcript = res
+    _, transcript = scan.match
     os.environ["PROMPT"] = transcript
 
-    output_dir = _default_output_dir()
-    output_dir.mkdir(parents=True, exist_ok=True)
-    config = AppConfig()
+    output_dir = _ensure_dir(_default_output_dir())
     result = generate_video_pipeline(config=config, output_dir=output_dir)
-    console.print(f"[green]Generated reaction video: {result.video_path}")
-    # Emit GitHub Actions outputs if available
-    try:
-        github_output = os.getenv("GITHUB_OUTPUT")
-        if github_output:
-            basename = Path(result.video_path).stem
-            work_dir = output_dir / basename
-            with open(github_output, "a", encoding="utf-8") as fh:
-                fh.write(f"video_path={result.video_path}\n")
-                fh.write(f"work_dir={work_dir}\n")
-    except Exception:
-        pass
+    _cprint(f"[green]Generated reaction video: {result.video_path}")
+    _emit_video_outputs(result.video_path, output_dir)
 
 
 
@@ -0,0 +1,57 @@
+import json
+
+from typer.testing import CliRunner
+
+from slop import cli, youtube_uploader
+from slop.uploader_config import YouTubeUploadConfig
+
+
+class StubUploader:
+    instances = []
+
+    def __init__(self, credentials_dir, config=None):
+        self.uploads = []
+        StubUploader.instances.append(self)
+
+    def upload_video(self, video_path, metadata, *, chunk_size):
+        if video_path.name == "broken.mp4":
+            raise RuntimeError("quota exceeded")
+        self.uploads.append((video_path.name, metadata.title, metadata.privacy_status))
+        return f"yt-{video_path.stem}"
+
+
+def test_serve_keeps_going_after_bad_jobs(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(StubUploader, "instances", [])
+    monkeypatch.setattr(youtube_uploader, "YouTubeUploader", StubUploader)
+    monkeypatch.setattr(cli, "_YOUTUBE_UPLOADERS", {})
+    monkeypatch.setattr(
+        cli, "get_youtube_upload_config", lambda: YouTubeUploadConfig(_env_file=None, youtube_privacy_status="unlisted")
+    )
+    for name in ("first.mp4", "broken.mp4", "last.mp4"):
+        (tmp_path / name).write_bytes(b"video")
+    lines = [
+        json.dumps({"video_path": str(tmp_path / "first.mp4"), "metadata": {"title": "First"}}),
+        "{not json",
+        json.dumps({"video_path": str(tmp_path / "broken.mp4")}),
+        "",
+        json.dumps({"video_path": str(tmp_path / "last.mp4"), "metadata": {"privacy_status": "private"}}),
+    ]
+
+    result = CliRunner().invoke(cli.app, ["serve", "--credentials-dir", str(tmp_path)], input="\n".join(lines) + "\n")
+
+    assert result.exit_code == 4
+    assert len(StubUploader.instances) == 1
+    assert StubUploader.instances[0].uploads == [
+        ("first.mp4", "First", "unlisted"),
+        ("last.mp4", "last", "private"),
+    ]
+    assert "Job 2 failed" in result.output
+    assert "Job 3 failed: quota exceeded" in result.output
+    assert "Video ID: yt-last" in result.output
+
+
+def test_cprint_strips_markup_in_plain_output(monkeypatch, capsys):
+    monkeypatch.setattr(cli, "_plain_output", lambda: True)
+    cli._cprint("[bold magenta]Done[/bold magenta] in [link=https://example.com]folder[/link] \\[kept]")
+    assert capsys.readouterr().out == "Done in folder [kept]\n"
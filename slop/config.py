@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import os
 from enum import Enum
+from functools import lru_cache
 from typing import Literal, Optional, Union
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -66,6 +68,8 @@ class AppConfig(BaseSettings):
 
     # YouTube upload visibility
     youtube_privacy_status: Literal["public", "unlisted", "private"] = "private"
+    # Resumable upload chunk size for videos too large to send in one request
+    upload_chunk_mb: int = 16
 
     # LLM provider selection
     llm_provider: LLMProvider = LLMProvider.OPENAI
@@ -73,9 +77,83 @@ class AppConfig(BaseSettings):
     deepseek_api_key: Optional[str] = None
     elevenlabs_api_key: Optional[str] = None
     drive_parent_folder_id: Optional[str] = None
+    # Concurrent file uploads when mirroring a work dir to Drive
+    drive_upload_concurrency: int = 4
 
     # OAuth credentials (single-source fields, optional)
     # Expect RAW JSON content. If not provided, uploaders will rely on existing files on disk.
     oauth_client_json: Optional[str] = None
     drive_token_json: Optional[str] = None
     youtube_token_json: Optional[str] = None
+
+    @property
+    def llm_api_key(self) -> Optional[str]:
+        """API key for the configured llm_provider."""
+        return self.deepseek_api_key if self.llm_provider == LLMProvider.DEEPSEEK else self.openai_api_key
+
+
+# Env var that holds the API key for each LLM provider
+LLM_API_KEY_ENV: dict[LLMProvider, str] = {
+    LLMProvider.OPENAI: "OPENAI_API_KEY",
+    LLMProvider.DEEPSEEK: "DEEPSEEK_API_KEY",
+}
+
+
+_DOTENV_MTIMES: dict[str, int] = {}
+
+
+@lru_cache(maxsize=1)
+def _dotenv_path() -> str:
+    from dotenv import find_dotenv
+
+    return find_dotenv()
+
+
+def load_env_file() -> None:
+    """Load .env into os.environ (without overriding), re-parsing only when the file changed.
+
+    The file is located once per process; later calls cost a single stat.
+    """
+    path = _dotenv_path()
+    if not path:
+        return
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return
+    if _DOTENV_MTIMES.get(path) == mtime:
+        return
+    from dotenv import load_dotenv
+
+    load_dotenv(path, override=False)
+    _DOTENV_MTIMES[path] = mtime
+
+
+@lru_cache(maxsize=1)
+def get_config() -> AppConfig:
+    """Return the process-wide AppConfig, parsing env/.env only once.
+
+    Call ``get_config.cache_clear()`` to force a re-read (e.g. in tests).
+    """
+    return AppConfig()
+
+
+def missing_required_env() -> list[str]:
+    """Return the names of required API keys that are not set for generation.
+
+    The LLM key depends on the configured provider; ElevenLabs is always required.
+    """
+    env = os.environ
+    missing: list[str] = []
+    try:
+        cfg = get_config()
+    except Exception:
+        # If config loading fails, check env vars directly
+        if not (env.get("OPENAI_API_KEY") or env.get("DEEPSEEK_API_KEY")):
+            missing.append("OPENAI_API_KEY or DEEPSEEK_API_KEY")
+    else:
+        if not cfg.llm_api_key:
+            missing.append(LLM_API_KEY_ENV[cfg.llm_provider])
+    if not env.get("ELEVENLABS_API_KEY"):
+        missing.append("ELEVENLABS_API_KEY")
+    return missing
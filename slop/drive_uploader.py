@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import asyncio
+import json
 import mimetypes
+import random
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 import os
 
 from google.auth.transport.requests import Request
@@ -13,12 +18,104 @@ from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaFileUpload
 
 from pydantic_settings import BaseSettings
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
 
 DRIVE_SCOPES = [
     "https://www.googleapis.com/auth/drive.file",  # App-created or opened files
 ]
 
 
+# Process-wide credentials by token path and file mtime (see youtube_uploader for the same cache)
+_CREDENTIALS_CACHE: dict[Path, tuple[Optional[int], Credentials]] = {}
+
+# Drive rejects batch requests with more than 100 calls
+_BATCH_LIMIT = 100
+
+# Drive's per-user write quota is ~10 requests/s, counted per call even inside a batch.
+# 429 and 5xx are transient and worth retrying, as is a 403 whose reason is a rate limit.
+_WRITES_PER_SECOND = 10
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+_RATE_LIMIT_REASONS = frozenset({"userRateLimitExceeded", "rateLimitExceeded"})
+
+
+class _RateLimiter:
+    """Space calls at least 1/rate seconds apart across all threads; a call may take several slots."""
+
+    def __init__(self, rate_per_second: float) -> None:
+        self._interval = 1.0 / rate_per_second
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self, slots: int = 1) -> None:
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self._interval * slots
+        if delay > 0:
+            time.sleep(delay)
+
+
+_WRITE_LIMITER = _RateLimiter(_WRITES_PER_SECOND)
+
+
+def _error_reasons(exc: HttpError) -> set[str]:
+    # Drive error bodies look like {"error": {"errors": [{"reason": "userRateLimitExceeded", ...}]}}
+    try:
+        return {str(err.get("reason")) for err in json.loads(exc.content)["error"]["errors"]}
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return set()
+
+
+def _is_retryable_http_error(exc: BaseException) -> bool:
+    if not isinstance(exc, HttpError):
+        return False
+    status = getattr(exc.resp, "status", None)
+    if status == 403:
+        return not _RATE_LIMIT_REASONS.isdisjoint(_error_reasons(exc))
+    return status in _RETRYABLE_STATUSES
+
+
+_MAX_ATTEMPTS = 5
+
+_retry_transient = retry(
+    wait=wait_random_exponential(multiplier=0.5, max=10),
+    stop=stop_after_attempt(_MAX_ATTEMPTS),
+    retry=retry_if_exception(_is_retryable_http_error),
+    reraise=True,
+)
+
+
+def _execute(request, *, writes: int = 1):
+    # Sent once: retrying a files().create whose response was lost would create a duplicate.
+    # A batch counts as one write per sub-request against the quota.
+    _WRITE_LIMITER.wait(writes)
+    return request.execute()
+
+
+@_retry_transient
+def _execute_idempotent(request):
+    # Only for calls that are safe to repeat, such as reads and permission grants
+    return _execute(request)
+
+
+@_retry_transient
+def _next_chunk(request):
+    return request.next_chunk()
+
+
+def _execute_resumable(request):
+    """Run a resumable media upload to completion.
+
+    Transient errors retry the current chunk only; the client keeps the upload session, so a
+    retried next_chunk() resumes from the last byte Drive acknowledged instead of starting over.
+    """
+    _WRITE_LIMITER.wait()
+    response = None
+    while response is None:
+        _, response = _next_chunk(request)
+    return response
+
+
 @dataclass
 class DriveUploadResult:
     file_id: str
@@ -33,6 +130,8 @@ class DriveUploader:
         self.client_secret_path = self.credentials_dir / "client_secret.json"
         self.token_path = self.credentials_dir / "drive_token.json"
         self._config = config
+        self._service = None
+        self._local = threading.local()
 
     def _materialize_oauth_files_from_config_or_env(self) -> None:
         # Use only AppConfig-provided JSON if available; otherwise rely on existing files
@@ -57,6 +156,10 @@ class DriveUploader:
                 pass
 
     def _get_credentials(self) -> Credentials:
+        cached = _CREDENTIALS_CACHE.get(self.token_path)
+        if cached is not None and cached[1].valid and cached[0] == _mtime_ns(self.token_path):
+            return cached[1]
+
         self._materialize_oauth_files_from_config_or_env()
         # Fail fast if required files are missing
         if not self.client_secret_path.exists():
@@ -106,6 +209,7 @@ class DriveUploader:
                 f"Required: {', '.join(required_scopes)} | Present: {', '.join(sorted(existing_scopes))}. "
                 "Generate a new token with the required scopes."
             )
+        _CREDENTIALS_CACHE[self.token_path] = (_mtime_ns(self.token_path), creds)
         return creds
 
     def authorize(self) -> Path:
@@ -113,8 +217,50 @@ class DriveUploader:
         return self.token_path
 
     def _build_service(self):
-        creds = self._get_credentials()
-        return build("drive", "v3", credentials=creds)
+        # Every folder/file call goes through here; build the discovery client only once
+        if self._service is None:
+            creds = self._get_credentials()
+            self._service = build("drive", "v3", credentials=creds)
+        return self._service
+
+    def _thread_service(self):
+        # httplib2 connections are not thread-safe; each upload worker gets its own client
+        service = getattr(self._local, "service", None)
+        if service is None:
+            service = build("drive", "v3", credentials=self._get_credentials())
+            self._local.service = service
+        return service
+
+    def _execute_batch(self, requests: list[tuple[str, object]], callback, *, retry_failed: bool = False) -> None:
+        """Send requests in batches of _BATCH_LIMIT, passing each sub-response to callback.
+
+        A batch is never re-sent as a whole. With retry_failed (only for idempotent calls),
+        sub-requests that failed with a transient error are re-sent on their own with backoff,
+        and callback only sees their final outcome.
+        """
+        drive = self._build_service()
+        by_id = dict(requests)
+        pending = [request_id for request_id, _ in requests]
+        failed: list[str] = []
+        attempt = 1
+
+        def _on_response(request_id, response, exception) -> None:
+            if retry_failed and attempt < _MAX_ATTEMPTS and _is_retryable_http_error(exception):
+                failed.append(request_id)
+            else:
+                callback(request_id, response, exception)
+
+        while pending:
+            for start in range(0, len(pending), _BATCH_LIMIT):
+                chunk = pending[start : start + _BATCH_LIMIT]
+                batch = drive.new_batch_http_request(callback=_on_response)
+                for request_id in chunk:
+                    batch.add(by_id[request_id], request_id=request_id)
+                _execute(batch, writes=len(chunk))
+            pending, failed = failed, []
+            if pending:
+                time.sleep(random.uniform(0, min(10.0, 0.5 * 2**attempt)))
+                attempt += 1
 
     def create_folder(self, name: str, *, parent_folder_id: Optional[str] = None, make_shareable: bool = True) -> str:
         drive = self._build_service()
@@ -124,18 +270,24 @@ class DriveUploader:
         }
         if parent_folder_id:
             body["parents"] = [parent_folder_id]
-        folder = drive.files().create(body=body, fields="id").execute()
+        folder = _execute(drive.files().create(body=body, fields="id"))
         folder_id = folder.get("id")
         if make_shareable and folder_id:
             try:
-                drive.permissions().create(
-                    fileId=folder_id,
-                    body={"role": "reader", "type": "anyone"},
-                ).execute()
+                _execute_idempotent(
+                    drive.permissions().create(
+                        fileId=folder_id,
+                        body={"role": "reader", "type": "anyone"},
+                    )
+                )
             except Exception:
                 pass
         return str(folder_id)
 
+    def delete_file(self, file_id: str) -> None:
+        """Delete a file or folder (including its contents) from Drive."""
+        _execute(self._build_service().files().delete(fileId=file_id))
+
     def upload_file(self, file_path: Path, *, parent_folder_id: Optional[str] = None, make_shareable: bool = True) -> DriveUploadResult:
         drive = self._build_service()
         mime_type, _ = mimetypes.guess_type(file_path)
@@ -147,10 +299,7 @@ class DriveUploader:
         if parent_folder_id:
             body["parents"] = [parent_folder_id]
 
-        try:
-            created = drive.files().create(body=body, media_body=media, fields="id, webViewLink").execute()
-        except HttpError:
-            raise
+        created = _execute_resumable(drive.files().create(body=body, media_body=media, fields="id, webViewLink"))
 
         file_id = created.get("id")
         web_link = created.get("webViewLink")
@@ -158,10 +307,12 @@ class DriveUploader:
         if make_shareable and file_id:
             try:
                 # Set anyone-with-link reader permission
-                drive.permissions().create(
-                    fileId=file_id,
-                    body={"role": "reader", "type": "anyone"},
-                ).execute()
+                _execute_idempotent(
+                    drive.permissions().create(
+                        fileId=file_id,
+                        body={"role": "reader", "type": "anyone"},
+                    )
+                )
                 # Refetch link with shortcut to ensure it's available
                 meta = drive.files().get(fileId=file_id, fields="webViewLink").execute()
                 web_link = meta.get("webViewLink") or web_link
@@ -175,7 +326,7 @@ class DriveUploader:
 
         This ensures per-scene audio chunks under subdirectories (e.g. `audio_chunks/`) are preserved on Drive.
         """
-        if not dir_path.exists() or not dir_path.is_dir():
+        if not dir_path.is_dir():
             raise FileNotFoundError(f"Directory not found: {dir_path}")
 
         def _upload_tree(local_dir: Path, drive_parent_id: Optional[str]) -> str:
@@ -199,4 +350,115 @@ class DriveUploader:
 
         return _upload_tree(dir_path, parent_folder_id)
 
+    def upload_bundle(
+        self,
+        dir_path: Path,
+        *,
+        extra_files: Iterable[Path] = (),
+        parent_folder_id: Optional[str] = None,
+        make_shareable: bool = True,
+        max_concurrency: int = 4,
+        existing_folder_id: Optional[str] = None,
+    ) -> str:
+        """Upload dir_path recursively plus extra_files into a new Drive folder and return its ID.
+
+        Subfolders are created one tree level per batch request and all sharing permissions go
+        out in a single batch at the end; file contents upload concurrently (bounded by
+        max_concurrency). Like upload_directory, files and folders inside dir_path are
+        best-effort, while failures uploading extra_files are raised. Pass existing_folder_id
+        to upload into an already created (e.g. pre-created) folder instead of a new one.
+        """
+        if not dir_path.is_dir():
+            raise FileNotFoundError(f"Directory not found: {dir_path}")
+
+        drive = self._build_service()
+        if existing_folder_id:
+            root_id = existing_folder_id
+        else:
+            root = _execute(drive.files().create(body=_folder_body(dir_path.name, parent_folder_id), fields="id"))
+            root_id = str(root.get("id"))
+
+        folder_ids: list[str] = [root_id]
+        tree_files: list[tuple[Path, str]] = []
+        level: list[tuple[Path, str]] = [(dir_path, root_id)]
+        while level:
+            subdirs: list[tuple[Path, str]] = []
+            for local_dir, folder_id in level:
+                for item in sorted(local_dir.iterdir()):
+                    if item.is_file():
+                        tree_files.append((item, folder_id))
+                    elif item.is_dir():
+                        subdirs.append((item, folder_id))
+
+            created: dict[str, str] = {}
+
+            def _on_folder(request_id, response, exception) -> None:
+                if exception is None and response:
+                    created[request_id] = str(response.get("id"))
+
+            self._execute_batch(
+                [
+                    (str(idx), drive.files().create(body=_folder_body(sub.name, parent_id), fields="id"))
+                    for idx, (sub, parent_id) in enumerate(subdirs)
+                ],
+                _on_folder,
+            )
+            level = [(sub, created[str(idx)]) for idx, (sub, _) in enumerate(subdirs) if str(idx) in created]
+            folder_ids.extend(folder_id for _, folder_id in level)
+
+        extra = [(Path(p), root_id) for p in extra_files]
+        jobs = tree_files + extra
+
+        def _upload(path: Path, folder_id: str) -> str:
+            mime_type, _ = mimetypes.guess_type(path)
+            media = MediaFileUpload(str(path), mimetype=mime_type or "application/octet-stream", resumable=True)
+            body = {"name": path.name, "parents": [folder_id]}
+            created_file = _execute_resumable(
+                self._thread_service().files().create(body=body, media_body=media, fields="id")
+            )
+            return str(created_file.get("id"))
+
+        async def _upload_all():
+            semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+            async def _one(path: Path, folder_id: str) -> str:
+                async with semaphore:
+                    return await asyncio.to_thread(_upload, path, folder_id)
+
+            return await asyncio.gather(*(_one(path, folder_id) for path, folder_id in jobs), return_exceptions=True)
+
+        results = asyncio.run(_upload_all())
+        for result in results[len(tree_files) :]:
+            if isinstance(result, BaseException):
+                raise result
+        file_ids = [result for result in results if not isinstance(result, BaseException)]
+
+        if make_shareable:
+            # Best-effort, like create_folder/upload_file: failed grants are ignored
+            self._execute_batch(
+                [
+                    (str(idx), drive.permissions().create(fileId=item_id, body={"role": "reader", "type": "anyone"}))
+                    for idx, item_id in enumerate(folder_ids + file_ids)
+                ],
+                lambda request_id, response, exception: None,
+                retry_failed=True,
+            )
+
+        return root_id
+
+
+def _folder_body(name: str, parent_folder_id: Optional[str]) -> dict:
+    body = {
+        "name": name,
+        "mimeType": "application/vnd.google-apps.folder",
+    }
+    if parent_folder_id:
+        body["parents"] = [parent_folder_id]
+    return body
+
 
+def _mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
@@ -0,0 +1,234 @@
+import json
+import threading
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+from slop import drive_uploader
+from slop.drive_uploader import DriveUploader
+
+
+def _http_error(status: int, reason: str = "") -> HttpError:
+    content = json.dumps({"error": {"code": status, "errors": [{"reason": reason}]}}).encode() if reason else b""
+    return HttpError(httplib2.Response({"status": status}), content)
+
+
+class FakeRequest:
+    def __init__(self, run):
+        self._run = run
+
+    def execute(self):
+        return self._run()
+
+    def next_chunk(self):
+        return None, self._run()
+
+
+class FakeBatch:
+    def __init__(self, service, callback):
+        self._service = service
+        self._callback = callback
+        self._requests = []
+
+    def add(self, request, request_id):
+        self._requests.append((request_id, request))
+
+    def execute(self):
+        self._service.batch_sizes.append(len(self._requests))
+        for request_id, request in self._requests:
+            try:
+                response = request.execute()
+            except HttpError as e:
+                self._callback(request_id, None, e)
+            else:
+                self._callback(request_id, response, None)
+
+
+class FakeDrive:
+    """Just enough of the Drive v3 client for upload_bundle."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._next_id = 0
+        self.folders = {}  # id -> (name, parent id)
+        self.uploads = {}  # id -> (name, parent id)
+        self.shared = []
+        self.batch_sizes = []
+        self.failing_folders = set()
+        self.flaky_permissions = {}  # file id -> transient failures left
+
+    def _new_id(self) -> str:
+        with self._lock:
+            self._next_id += 1
+            return f"id{self._next_id}"
+
+    def files(self):
+        return self
+
+    def permissions(self):
+        return _FakePermissions(self)
+
+    def create(self, body, fields, media_body=None):
+        def run():
+            if body["name"] in self.failing_folders:
+                raise _http_error(500)
+            item_id = self._new_id()
+            record = (body["name"], body.get("parents", [None])[0])
+            if media_body is None:
+                self.folders[item_id] = record
+            else:
+                self.uploads[item_id] = record
+            return {"id": item_id}
+
+        return FakeRequest(run)
+
+    def new_batch_http_request(self, callback):
+        return FakeBatch(self, callback)
+
+
+class _FakePermissions:
+    def __init__(self, drive: FakeDrive):
+        self._drive = drive
+
+    def create(self, fileId, body):
+        def run():
+            left = self._drive.flaky_permissions.get(fileId, 0)
+            if left:
+                self._drive.flaky_permissions[fileId] = left - 1
+                raise _http_error(503)
+            self._drive.shared.append(fileId)
+            return {"id": "anyoneWithLink"}
+
+        return FakeRequest(run)
+
+
+@pytest.fixture
+def drive(monkeypatch):
+    monkeypatch.setattr(drive_uploader, "_WRITE_LIMITER", drive_uploader._RateLimiter(1e9))
+    monkeypatch.setattr(drive_uploader.random, "uniform", lambda a, b: 0)
+    return FakeDrive()
+
+
+@pytest.fixture
+def uploader(tmp_path, drive, monkeypatch):
+    uploader = DriveUploader(tmp_path / "creds")
+    monkeypatch.setattr(uploader, "_build_service", lambda: drive)
+    monkeypatch.setattr(uploader, "_thread_service", lambda: drive)
+    return uploader
+
+
+def _names_by_id(items: dict) -> dict:
+    return {item_id: name for item_id, (name, _) in items.items()}
+
+
+def test_upload_bundle_nested_folders(tmp_path, drive, uploader):
+    work = tmp_path / "work"
+    (work / "audio" / "chunks").mkdir(parents=True)
+    (work / "title.txt").write_text("t")
+    (work / "audio" / "scene1.mp3").write_bytes(b"a")
+    (work / "audio" / "chunks" / "c1.mp3").write_bytes(b"c")
+    video = tmp_path / "work.mp4"
+    video.write_bytes(b"v")
+
+    root_id = uploader.upload_bundle(work, extra_files=[video], parent_folder_id="parent")
+
+    folder_ids = {name: item_id for item_id, name in _names_by_id(drive.folders).items()}
+    assert drive.folders[root_id] == ("work", "parent")
+    assert drive.folders[folder_ids["audio"]] == ("audio", root_id)
+    assert drive.folders[folder_ids["chunks"]] == ("chunks", folder_ids["audio"])
+    assert sorted(drive.uploads.values()) == sorted(
+        [
+            ("title.txt", root_id),
+            ("work.mp4", root_id),
+            ("scene1.mp3", folder_ids["audio"]),
+            ("c1.mp3", folder_ids["chunks"]),
+        ]
+    )
+    assert sorted(drive.shared) == sorted([*drive.folders, *drive.uploads])
+
+
+def test_upload_bundle_splits_batches_over_limit(tmp_path, drive, uploader):
+    work = tmp_path / "work"
+    for idx in range(drive_uploader._BATCH_LIMIT + 5):
+        (work / f"scene{idx:03d}").mkdir(parents=True)
+
+    uploader.upload_bundle(work)
+
+    # One folder-create batch split in two, then the same for the permission grants
+    limit = drive_uploader._BATCH_LIMIT
+    assert drive.batch_sizes == [limit, 5, limit, 6]
+    assert len(drive.folders) == limit + 6
+
+
+def test_upload_bundle_reuses_existing_folder(tmp_path, drive, uploader):
+    work = tmp_path / "work"
+    work.mkdir()
+    (work / "script.txt").write_text("s")
+
+    root_id = uploader.upload_bundle(work, existing_folder_id="precreated", make_shareable=False)
+
+    assert root_id == "precreated"
+    assert drive.folders == {}
+    assert list(drive.uploads.values()) == [("script.txt", "precreated")]
+    assert drive.shared == []
+
+
+def test_upload_bundle_failed_folder_is_skipped_not_retried(tmp_path, drive, uploader):
+    work = tmp_path / "work"
+    (work / "bad").mkdir(parents=True)
+    (work / "good").mkdir()
+    (work / "bad" / "lost.txt").write_text("x")
+    (work / "good" / "kept.txt").write_text("y")
+    drive.failing_folders.add("bad")
+
+    uploader.upload_bundle(work, make_shareable=False)
+
+    assert sorted(_names_by_id(drive.folders).values()) == ["good", "work"]
+    assert [name for name, _ in drive.uploads.values()] == ["kept.txt"]
+    # Folder creates are not idempotent, so the failed one is not sent again
+    assert drive.batch_sizes == [2]
+
+
+def test_upload_bundle_retries_only_failed_permission(tmp_path, drive, uploader):
+    work = tmp_path / "work"
+    work.mkdir()
+    (work / "a.txt").write_text("a")
+    (work / "b.txt").write_text("b")
+    drive.flaky_permissions["id1"] = 1  # the root folder's grant fails once
+
+    root_id = uploader.upload_bundle(work)
+
+    assert root_id == "id1"
+    assert sorted(drive.shared) == ["id1", "id2", "id3"]
+    assert drive.batch_sizes == [3, 1]
+
+
+def test_rate_limited_403_is_retryable():
+    assert drive_uploader._is_retryable_http_error(_http_error(403, "userRateLimitExceeded"))
+    assert drive_uploader._is_retryable_http_error(_http_error(403, "rateLimitExceeded"))
+    assert not drive_uploader._is_retryable_http_error(_http_error(403, "insufficientFilePermissions"))
+    assert not drive_uploader._is_retryable_http_error(_http_error(403))
+    assert not drive_uploader._is_retryable_http_error(_http_error(404))
+
+
+class RecordingLimiter:
+    def __init__(self):
+        self.slots = []
+
+    def wait(self, slots=1):
+        self.slots.append(slots)
+
+
+def test_batches_take_one_limiter_slot_per_sub_request(tmp_path, drive, uploader, monkeypatch):
+    limiter = RecordingLimiter()
+    monkeypatch.setattr(drive_uploader, "_WRITE_LIMITER", limiter)
+    work = tmp_path / "work"
+    for idx in range(drive_uploader._BATCH_LIMIT + 5):
+        (work / f"scene{idx:03d}").mkdir(parents=True)
+
+    uploader.upload_bundle(work)
+
+    limit = drive_uploader._BATCH_LIMIT
+    # Root folder create, then the folder-create and permission batches
+    assert limiter.slots == [1, limit, 5, limit, 6]
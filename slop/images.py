@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import asyncio
+import io
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Tuple, Optional
 
@@ -39,16 +41,13 @@ async def _generate_single_image_openai_async(
 	out_path = output_dir / f"frame_{index:03d}.png"
 	with open(out_path, "wb") as f:
 		f.write(img_bytes)
-	try:
-		sz = os.path.getsize(out_path)
-		logger.info("[images/openai] saved | i=%d path=%s bytes=%d", index, str(out_path), sz)
-	except Exception:
-		pass
+	logger.info("[images/openai] saved | i=%d path=%s bytes=%d", index, str(out_path), len(img_bytes))
 	# Ensure no alpha channel (avoid transparent images turning into black frames after ffmpeg)
 	try:
 		from PIL import Image  # type: ignore
 		from PIL import ImageStat, ImageOps, ImageEnhance  # type: ignore
-		with Image.open(out_path) as im:
+		# Inspect the decoded bytes already in memory instead of re-reading the file just written
+		with Image.open(io.BytesIO(img_bytes)) as im:
 			if im.mode in ("RGBA", "LA", "P"):
 				# Flatten on white background to avoid black frames when transparency dominates
 				rgb = Image.new("RGB", im.size, (255, 255, 255))
@@ -76,6 +75,19 @@ async def _generate_single_image_openai_async(
 	return out_path
 
 
+def _log_file_sizes(paths: List[Path], tag: str) -> None:
+	"""Log final on-disk sizes, overlapping the stat calls across a small thread pool."""
+	if not paths:
+		return
+	try:
+		with ThreadPoolExecutor(max_workers=min(8, len(paths))) as ex:
+			sizes = list(ex.map(os.path.getsize, paths))
+		for p, sz in zip(paths, sizes):
+			logger.info("%s file | path=%s bytes=%d", tag, str(p), sz)
+	except Exception:
+		pass
+
+
 ## Removed: _describe_scenes_with_llm_async — the main flow now always supplies image prompts from structured scenes.
 
 
@@ -131,11 +143,7 @@ def generate_images(
 		)
 	)
 	# Print sizes for quick diagnostics
-	try:
-		for p in paths:
-			logger.info("[images] file | path=%s bytes=%d", str(p), os.path.getsize(p))
-	except Exception:
-		pass
+	_log_file_sizes(paths, "[images]")
 	return paths
 
 
@@ -190,11 +198,7 @@ async def generate_images_async(
 		scene_prompts, output_dir, concurrency, model=image_model, size=image_size, quality=image_quality
 	)
 	# Print sizes for quick diagnostics
-	try:
-		for p in paths:
-			logger.info("[images/async] file | path=%s bytes=%d", str(p), os.path.getsize(p))
-	except Exception:
-		pass
+	_log_file_sizes(paths, "[images/async]")
 	return paths
 
 
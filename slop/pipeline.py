@@ -3,12 +3,14 @@ from __future__ import annotations
 from datetime import datetime
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Callable, Optional
 import os
+import sys
 import json
 import asyncio
 import logging
 
-from .config import AppConfig, LLMProvider
+from .config import AppConfig
 from .utils import sanitize_title
 from .scriptgen import generate_topic_and_scenes
 from .images import generate_images, generate_images_async
@@ -22,7 +24,7 @@ from .stitch import stitch_video
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GeneratedVideo:
     video_path: Path
     topic: str
@@ -54,7 +56,7 @@ def generate_video_pipeline(config: AppConfig, output_dir: Path) -> GeneratedVid
     num_scenes = max(1, config.num_images)
     user_input = prompt_raw.strip() if prompt_raw else ""
     logger.info("[pipeline] generating topic and scenes | words_target≈%d scenes=%d", int(config.duration_seconds * 2.5), num_scenes)
-    api_key = config.deepseek_api_key if config.llm_provider == LLMProvider.DEEPSEEK else config.openai_api_key
+    api_key = config.llm_api_key
     topic, scenes = generate_topic_and_scenes(
         input_text=user_input,
         target_duration_seconds=config.duration_seconds,
@@ -74,7 +76,9 @@ def generate_video_pipeline(config: AppConfig, output_dir: Path) -> GeneratedVid
         with open(scenes_json_path, "w", encoding="utf-8") as f:
             json.dump(scenario_dict, f, ensure_ascii=False, indent=2)
         print(f"[scenes] wrote {scenes_json_path}")
-        print(json.dumps(scenario_dict, ensure_ascii=False, indent=2))
+        # Stream straight to stdout instead of building a second full JSON string
+        json.dump(scenario_dict, sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write("\n")
     except Exception:
         pass
 
@@ -105,13 +109,13 @@ def generate_video_pipeline(config: AppConfig, output_dir: Path) -> GeneratedVid
             output_dir=work_dir,
             model_id=config.tts_model_id,
             output_format=config.tts_output_format,
-            concurrency=max(1, int(getattr(config, "tts_concurrency", 4))),
+            concurrency=max(1, config.tts_concurrency),
             stability=config.stability,
             similarity_boost=config.similarity_boost,
             style=config.style,
             use_speaker_boost=config.use_speaker_boost,
             speed=config.speed,
-            api_key=getattr(config, "elevenlabs_api_key", None),
+            api_key=config.elevenlabs_api_key,
         )
         image_paths, (audio_path, durations_by_scene) = await asyncio.gather(images_task, tts_task)
         return image_paths, audio_path, None, durations_by_scene
@@ -147,12 +151,14 @@ def render_video_from_scenes(
     scenes: list["Scene"],
     output_dir: Path,
     topic: str | None = None,
+    on_basename: Optional[Callable[[str], None]] = None,
 ) -> GeneratedVideo:
     """Render a video from provided scenes without generating them.
 
     Uses the same image generation, TTS (chunked with durations), and stitching steps
     as the main pipeline. Writes working artifacts into a timestamped subdirectory
-    under the provided output directory.
+    under the provided output directory. If given, on_basename is called with the
+    chosen basename as soon as it is known, before any rendering work starts.
     """
     # Local import to avoid circular import at module load time
     from .scriptgen import Scene  # type: ignore
@@ -166,6 +172,8 @@ def render_video_from_scenes(
     basename = f"video_{timestamp}"
     work_dir = output_dir / basename
     work_dir.mkdir(parents=True, exist_ok=True)
+    if on_basename is not None:
+        on_basename(basename)
 
     # Persist optional topic/title for downstream steps
     safe_topic = sanitize_title(topic or "Manual Scenes")
@@ -205,13 +213,13 @@ def render_video_from_scenes(
             output_dir=work_dir,
             model_id=config.tts_model_id,
             output_format=config.tts_output_format,
-            concurrency=max(1, int(getattr(config, "tts_concurrency", 4))),
+            concurrency=max(1, config.tts_concurrency),
             stability=config.stability,
             similarity_boost=config.similarity_boost,
             style=config.style,
             use_speaker_boost=config.use_speaker_boost,
             speed=config.speed,
-            api_key=getattr(config, "elevenlabs_api_key", None),
+            api_key=config.elevenlabs_api_key,
         )
         image_paths, (audio_path, durations_by_scene) = await asyncio.gather(images_task, tts_task)
         return image_paths, audio_path, None, durations_by_scene
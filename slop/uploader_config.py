@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Literal, Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -9,6 +10,8 @@ class YouTubeUploadConfig(BaseSettings):
     model_config = SettingsConfigDict(env_file='.env', env_file_encoding='utf-8')
 
     youtube_privacy_status: Literal["public", "unlisted", "private"] = "private"
+    # Resumable upload chunk size for videos too large to send in one request
+    upload_chunk_mb: int = 16
 
     # OAuth credentials (optional, can rely on files on disk instead)
     oauth_client_json: Optional[str] = None
@@ -20,8 +23,21 @@ class DriveUploadConfig(BaseSettings):
 
     # Default parent folder; optional to allow skipping when not using Drive
     drive_parent_folder_id: Optional[str] = None
+    # Concurrent file uploads when mirroring a work dir to Drive
+    drive_upload_concurrency: int = 4
 
     # OAuth credentials (optional, can rely on files on disk instead)
     oauth_client_json: Optional[str] = None
     drive_token_json: Optional[str] = None
 
+
+@lru_cache(maxsize=1)
+def get_youtube_upload_config() -> YouTubeUploadConfig:
+    """Return the process-wide YouTubeUploadConfig, parsing env/.env only once."""
+    return YouTubeUploadConfig()
+
+
+@lru_cache(maxsize=1)
+def get_drive_upload_config() -> DriveUploadConfig:
+    """Return the process-wide DriveUploadConfig, parsing env/.env only once."""
+    return DriveUploadConfig()
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from pathlib import Path
+from typing import Optional
+
 
 _QUOTE_CHARS = "\"'“”‘’`"
 
@@ -53,3 +56,14 @@ def sanitize_title(raw_title: str) -> str:
     return title
 
 
+def read_stripped_text(path: Path) -> Optional[str]:
+    """Return the stripped contents of a small text file (prompt.txt, title.txt), or None if it is missing or blank.
+
+    Opens the file directly (no separate exists() stat). Like a missing file, one that cannot be
+    read (a directory, no permission, not UTF-8) is treated as absent.
+    """
+    try:
+        content = path.read_text(encoding="utf-8").strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+    return content or None
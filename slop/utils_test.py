@@ -0,0 +1,47 @@
+from slop.utils import read_stripped_text, sanitize_title
+
+
+def test_read_stripped_text_strips_content(tmp_path):
+    path = tmp_path / "prompt.txt"
+    path.write_text("\n  Opowiedz o Bałtyku  \n", encoding="utf-8")
+    assert read_stripped_text(path) == "Opowiedz o Bałtyku"
+
+
+def test_read_stripped_text_missing_or_blank(tmp_path):
+    assert read_stripped_text(tmp_path / "missing.txt") is None
+    blank = tmp_path / "blank.txt"
+    blank.write_text(" \n\t", encoding="utf-8")
+    assert read_stripped_text(blank) is None
+    empty = tmp_path / "empty.txt"
+    empty.touch()
+    assert read_stripped_text(empty) is None
+
+
+def test_read_stripped_text_unreadable(tmp_path):
+    not_utf8 = tmp_path / "latin1.txt"
+    not_utf8.write_bytes("zażółć".encode("iso-8859-2"))
+    assert read_stripped_text(not_utf8) is None
+    directory = tmp_path / "prompt.txt"
+    directory.mkdir()
+    assert read_stripped_text(directory) is None
+
+
+def test_read_stripped_text_sees_updates(tmp_path):
+    path = tmp_path / "prompt.txt"
+    path.write_text("first", encoding="utf-8")
+    assert read_stripped_text(path) == "first"
+    path.write_text("second prompt", encoding="utf-8")
+    assert read_stripped_text(path) == "second prompt"
+
+
+def test_read_stripped_text_large_file(tmp_path):
+    path = tmp_path / "transcript.txt"
+    body = "zażółć gęślą jaźń " * 10_000
+    path.write_text("\n\t " + body + " \n", encoding="utf-8")
+    assert read_stripped_text(path) == body.strip()
+
+
+def test_sanitize_title_strips_quotes():
+    assert sanitize_title('  „Bałtyk"  ') == "„Bałtyk"
+    assert sanitize_title("“Bałtyk”") == "Bałtyk"
+    assert sanitize_title(None) == ""
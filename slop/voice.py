@@ -4,6 +4,7 @@ from pathlib import Path
 import os
 from typing import Dict, Any, Tuple, Optional, List
 import base64
+from functools import lru_cache
 import logging
 import subprocess
 import shutil
@@ -20,6 +21,25 @@ from typing import Tuple as _Tuple
 
 logger = logging.getLogger(__name__)
 
+# Models that reject previous_text/next_text in convert_with_timestamps
+_CONTEXT_UNSUPPORTED_MODELS = frozenset({"eleven_v3"})
+
+
+@lru_cache(maxsize=1)
+def _voice_settings_fields() -> frozenset[str]:
+    """Field names VoiceSettings accepts in the installed SDK (empty if unknown); fixed per process."""
+    try:
+        # pydantic v2 models expose model_fields
+        model_fields = getattr(VoiceSettings, "model_fields", None)
+        if model_fields:
+            return frozenset(model_fields.keys())
+        annotations = getattr(VoiceSettings, "__annotations__", None)
+        if annotations:
+            return frozenset(annotations.keys())
+    except Exception:
+        pass
+    return frozenset()
+
 
 def _extract_audio_base64(response: Any) -> Optional[str]:
     """Extract base64 audio from various possible SDK response shapes."""
@@ -93,18 +113,7 @@ def synthesize_voice_with_alignment(
         requested_settings["speed"] = speed
 
     # Filter to fields supported by installed SDK to avoid runtime errors
-    allowed_fields = set()
-    try:
-        # pydantic v2 models expose model_fields
-        model_fields = getattr(VoiceSettings, "model_fields", None)
-        if model_fields:
-            allowed_fields = set(model_fields.keys())
-        else:
-            annotations = getattr(VoiceSettings, "__annotations__", None)
-            if annotations:
-                allowed_fields = set(annotations.keys())
-    except Exception:
-        allowed_fields = set()
+    allowed_fields = _voice_settings_fields()
 
     if requested_settings:
         settings_kwargs = (
@@ -114,12 +123,13 @@ def synthesize_voice_with_alignment(
             tts_kwargs["voice_settings"] = VoiceSettings(**settings_kwargs)
 
     response = client.text_to_speech.convert_with_timestamps(**tts_kwargs)
-    # Debug: log which attributes exist on the response
-    try:
-        keys_or_attrs = list(response.keys()) if isinstance(response, dict) else dir(response)
-        logger.debug("[tts] response attrs: %s", keys_or_attrs)
-    except Exception:
-        pass
+    # Debug: log which attributes exist on the response (dir() only runs when DEBUG is enabled)
+    if logger.isEnabledFor(logging.DEBUG):
+        try:
+            keys_or_attrs = list(response.keys()) if isinstance(response, dict) else dir(response)
+            logger.debug("[tts] response attrs: %s", keys_or_attrs)
+        except Exception:
+            pass
 
     audio_b64 = _extract_audio_base64(response)
 
@@ -200,17 +210,7 @@ async def synthesize_voice_with_alignment_async(
     if speed is not None:
         requested_settings["speed"] = speed
 
-    allowed_fields = set()
-    try:
-        model_fields = getattr(VoiceSettings, "model_fields", None)
-        if model_fields:
-            allowed_fields = set(model_fields.keys())
-        else:
-            annotations = getattr(VoiceSettings, "__annotations__", None)
-            if annotations:
-                allowed_fields = set(annotations.keys())
-    except Exception:
-        allowed_fields = set()
+    allowed_fields = _voice_settings_fields()
 
     if requested_settings:
         settings_kwargs = (
@@ -221,11 +221,12 @@ async def synthesize_voice_with_alignment_async(
 
     response = await client.text_to_speech.convert_with_timestamps(**tts_kwargs)  # type: ignore[attr-defined]
 
-    try:
-        keys_or_attrs = list(response.keys()) if isinstance(response, dict) else dir(response)
-        logger.debug("[tts/async] response attrs: %s", keys_or_attrs)
-    except Exception:
-        pass
+    if logger.isEnabledFor(logging.DEBUG):
+        try:
+            keys_or_attrs = list(response.keys()) if isinstance(response, dict) else dir(response)
+            logger.debug("[tts/async] response attrs: %s", keys_or_attrs)
+        except Exception:
+            pass
 
     audio_b64 = _extract_audio_base64(response)
     if not audio_b64:
@@ -297,8 +298,7 @@ async def synthesize_voice_with_alignment_chunked_async(
     client = AsyncElevenLabs(api_key=api_key) if api_key else AsyncElevenLabs()  # type: ignore
 
     # Guard: Some models don't support previous_text/next_text
-    unsupported_models = {"eleven_v3"}
-    if model_id in unsupported_models:
+    if model_id in _CONTEXT_UNSUPPORTED_MODELS:
         raise RuntimeError(
             f"Model '{model_id}' does not support previous_text/next_text for convert_with_timestamps. "
             "Use a context-enabled model like 'eleven_turbo_v2'."
@@ -317,17 +317,7 @@ async def synthesize_voice_with_alignment_chunked_async(
     if speed is not None:
         requested_settings["speed"] = speed
 
-    allowed_fields = set()
-    try:
-        model_fields = getattr(VoiceSettings, "model_fields", None)
-        if model_fields:
-            allowed_fields = set(model_fields.keys())
-        else:
-            annotations = getattr(VoiceSettings, "__annotations__", None)
-            if annotations:
-                allowed_fields = set(annotations.keys())
-    except Exception:
-        allowed_fields = set()
+    allowed_fields = _voice_settings_fields()
 
     voice_settings = None
     if requested_settings:
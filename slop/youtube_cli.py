@@ -1,38 +1,52 @@
 from __future__ import annotations
 
+import functools
 import os
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
-from dotenv import load_dotenv
-from rich.console import Console
 
-from .youtube_uploader import YouTubeUploader, UploadMetadata
-from .config import AppConfig
+from .config import get_config, load_env_file
+
+if TYPE_CHECKING:
+    from rich.console import Console
 
 
-console = Console()
 app = typer.Typer(help="slop-youtube - Upload videos to YouTube", no_args_is_help=True)
 
 
+@functools.cache
+def _console() -> Console:
+    """Shared rich Console, created (and rich.console imported) on first print."""
+    from rich.console import Console
+
+    return Console()
+
+
 def ensure_env_loaded() -> None:
-    load_dotenv()
+    load_env_file()
+
+
+def _credentials_path(credentials_dir: Optional[str]) -> Path:
+    return Path(credentials_dir) if credentials_dir else Path.cwd()
 
 
 @app.command()
 def auth(
-    credentials_dir: str = typer.Option(
-        str(Path.cwd()),
-        help="Directory to store OAuth credentials (client_secret.json, token.json)",
+    credentials_dir: Optional[str] = typer.Option(
+        None,
+        help="Directory to store OAuth credentials (client_secret.json, token.json); defaults to the current directory",
     ),
 ):
     """Run OAuth flow and save token.json in the credentials directory."""
+    from .youtube_uploader import YouTubeUploader
+
     ensure_env_loaded()
-    config = AppConfig()
-    uploader = YouTubeUploader(credentials_dir=Path(credentials_dir), config=config)
+    config = get_config()
+    uploader = YouTubeUploader(credentials_dir=_credentials_path(credentials_dir), config=config)
     token_path = uploader.authorize()
-    console.print(f"[green]Saved YouTube OAuth token to: {token_path}")
+    _console().print(f"[green]Saved YouTube OAuth token to: {token_path}")
 
 
 @app.command()
@@ -44,12 +58,14 @@ def upload(
     category_id: int = typer.Option(22, help="YouTube category ID (default 22: People & Blogs)"),
     privacy_status: str = typer.Option("public", help="public | unlisted | private"),
     thumbnail_path: Optional[str] = typer.Option(None, help="Optional path to a thumbnail image"),
-    credentials_dir: str = typer.Option(
-        str(Path.cwd()),
-        help="Directory to store OAuth credentials (client_secret.json, token.json)",
+    credentials_dir: Optional[str] = typer.Option(
+        None,
+        help="Directory to store OAuth credentials (client_secret.json, token.json); defaults to the current directory",
     ),
 ) -> None:
     """Upload a video to YouTube with OAuth 2.0 (resumable)."""
+    from .youtube_uploader import UploadMetadata, YouTubeUploader
+
     ensure_env_loaded()
 
     video = Path(video_path)
@@ -62,8 +78,8 @@ def upload(
     if tags:
         tag_list = [t.strip() for t in tags.split(",") if t.strip()]
 
-    config = AppConfig()
-    uploader = YouTubeUploader(credentials_dir=Path(credentials_dir), config=config)
+    config = get_config()
+    uploader = YouTubeUploader(credentials_dir=_credentials_path(credentials_dir), config=config)
 
     metadata = UploadMetadata(
         title=resolved_title,
@@ -77,7 +93,7 @@ def upload(
     if thumbnail_path:
         uploader.set_thumbnail(video_id=video_id, thumbnail_path=Path(thumbnail_path))
 
-    console.print(f"[green]Uploaded video with ID: {video_id}")
+    _console().print(f"[green]Uploaded video with ID: {video_id}")
 
 
 if __name__ == "__main__":
@@ -4,10 +4,73 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 from datetime import datetime, timezone, timedelta
+import asyncio
+import json
 import logging
 import os
 import re
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+logger = logging.getLogger(__name__)
+
+_RAPIDAPI_BASE_URL = "https://yt-api.p.rapidapi.com"
+
+# Shared session so repeated RapidAPI calls reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]),
+    ),
+)
+
+
+_CACHE_DIR = Path.home() / ".cache" / "slop"
+_CHANNELS_CACHE_PATH = _CACHE_DIR / "channels.json"
+_CHANNEL_ID_TTL_SECONDS = 24 * 60 * 60
+_CHANNEL_ID_MEMORY_CACHE: dict[str, str] = {}
+_TRANSCRIPTS_CACHE_DIR = _CACHE_DIR / "transcripts"
+# Transcripts rarely change, but auto-generated ones can be replaced; refetch after a week
+_TRANSCRIPT_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
+def _load_channels_cache() -> dict:
+    try:
+        data = json.loads(_CHANNELS_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _read_cached_channel_id(handle: str) -> Optional[str]:
+    """Return a handle's channel ID from the on-disk cache if the entry is younger than the TTL."""
+    entry = _load_channels_cache().get(handle)
+    if not isinstance(entry, dict):
+        return None
+    cid = entry.get("channel_id")
+    ts = entry.get("ts")
+    if isinstance(cid, str) and isinstance(ts, (int, float)) and ts > time.time() - _CHANNEL_ID_TTL_SECONDS:
+        return cid
+    return None
+
+
+def _write_cached_channel_id(handle: str, channel_id: str) -> None:
+    """Persist handle -> channel ID atomically; cache failures never break resolution."""
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        data = _load_channels_cache()
+        data[handle] = {"channel_id": channel_id, "ts": time.time()}
+        tmp_path = _CHANNELS_CACHE_PATH.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp_path, _CHANNELS_CACHE_PATH)
+    except OSError:
+        logger.warning("Failed to write channel ID cache at %s", _CHANNELS_CACHE_PATH, exc_info=True)
 
 
 @dataclass
@@ -33,14 +96,14 @@ class YouTubePublicMonitor:
 
     def _rapidapi_get(self, path: str, params: dict) -> Optional[dict]:
         try:
-            resp = requests.get(
-                f"https://yt-api.p.rapidapi.com/{path.lstrip('/')}",
+            resp = _SESSION.get(
+                f"{_RAPIDAPI_BASE_URL}/{path.lstrip('/')}",
                 headers=self._rapidapi_headers(),
                 params=params,
                 timeout=30,
             )
             resp.raise_for_status()
-            data = resp.json()
+            data = json.loads(resp.content)
             if isinstance(data, dict):
                 return data
             if isinstance(data, list):
@@ -60,6 +123,19 @@ class YouTubePublicMonitor:
             return handle
         if not handle.startswith("@"):
             handle = f"@{handle}"
+        key = handle.lower()
+        cached = _CHANNEL_ID_MEMORY_CACHE.get(key) or _read_cached_channel_id(key)
+        if cached:
+            self.logger.debug("Using cached channel ID for %s: %s", handle, cached)
+            _CHANNEL_ID_MEMORY_CACHE[key] = cached
+            return cached
+        cid = self._resolve_channel_id_remote(handle)
+        if cid:
+            _CHANNEL_ID_MEMORY_CACHE[key] = cid
+            _write_cached_channel_id(key, cid)
+        return cid
+
+    def _resolve_channel_id_remote(self, handle: str) -> Optional[str]:
         resp = self._rapidapi_get("channel/videos", {"forUsername": handle})
         if not resp:
             return None
@@ -120,7 +196,7 @@ def _extract_iso_published_at(item: dict) -> Optional[str]:
         val = item.get(key)
         if isinstance(val, str) and val:
             try:
-                dt = datetime.fromisoformat(val.replace("Z", "+00:00"))
+                dt = datetime.fromisoformat(val)
                 return dt.astimezone(timezone.utc).isoformat()
             except Exception:
                 pass
@@ -156,14 +232,14 @@ def _fetch_transcript_via_rapidapi(video_id: str, preferred_languages: Optional[
     }
     # 1) Query available subtitle tracks
     try:
-        meta_resp = requests.get(
-            "https://yt-api.p.rapidapi.com/subtitles",
+        meta_resp = _SESSION.get(
+            f"{_RAPIDAPI_BASE_URL}/subtitles",
             headers=headers,
             params={"id": video_id},
             timeout=30,
         )
         meta_resp.raise_for_status()
-        meta = meta_resp.json()
+        meta = json.loads(meta_resp.content)
     except Exception:
         return None
 
@@ -185,21 +261,24 @@ def _fetch_transcript_via_rapidapi(video_id: str, preferred_languages: Optional[
     if "en" not in expanded_prefs:
         expanded_prefs.append("en")
 
+    # Lowercased preference -> rank of its first occurrence
+    pref_rank: dict[str, int] = {}
+    for idx, pref in enumerate(expanded_prefs):
+        pref_rank.setdefault(pref.lower(), idx)
+
     def track_score(t: dict) -> int:
         code = (t.get("languageCode") or "").lower()
         # Highest priority for exact matches by order, then base code
-        for idx, pref in enumerate(expanded_prefs):
-            if code == pref.lower():
-                return 1000 - idx
-        base = code.split("-", 1)[0]
-        for idx, pref in enumerate(expanded_prefs):
-            if base == pref.lower():
-                return 500 - idx
-        # Prefer non-empty url
-        return 0 if t.get("url") else -100
-
-    tracks_sorted = sorted(tracks, key=track_score, reverse=True)
-    chosen = next((t for t in tracks_sorted if t.get("url")), None)
+        rank = pref_rank.get(code)
+        if rank is not None:
+            return 1000 - rank
+        rank = pref_rank.get(code.split("-", 1)[0])
+        if rank is not None:
+            return 500 - rank
+        return 0
+
+    # Only tracks with a url are usable; max keeps the first of equally scored tracks
+    chosen = max((t for t in tracks if t.get("url")), key=track_score, default=None)
     if not chosen:
         return None
 
@@ -209,12 +288,12 @@ def _fetch_transcript_via_rapidapi(video_id: str, preferred_languages: Optional[
 
     # 3) Download and parse subtitle content (JSON or XML)
     try:
-        sub_resp = requests.get(subtitle_url, timeout=30)
+        sub_resp = _SESSION.get(subtitle_url, timeout=30)
         sub_resp.raise_for_status()
         text: Optional[str] = None
         # Try JSON first
         try:
-            jd = sub_resp.json()
+            jd = json.loads(sub_resp.content)
             # JSON formats generally have events -> segs -> utf8
             events = []
             if isinstance(jd, dict):
@@ -256,6 +335,37 @@ def _fetch_transcript_via_rapidapi(video_id: str, preferred_languages: Optional[
         return None
 
 
+def _read_cached_transcript(cache_path: Path) -> Optional[str]:
+    """Return a cached transcript younger than the TTL; stale, empty or unreadable entries are misses."""
+    try:
+        if cache_path.stat().st_mtime < time.time() - _TRANSCRIPT_CACHE_TTL_SECONDS:
+            return None
+        return cache_path.read_text(encoding="utf-8") or None
+    except FileNotFoundError:
+        return None
+    except (OSError, UnicodeDecodeError):
+        logger.warning("Failed to read transcript cache at %s", cache_path, exc_info=True)
+        return None
+
+
+def _fetch_transcript_cached(video_id: str, lang: str) -> Optional[str]:
+    """Fetch a transcript via RapidAPI, reusing a recent download from the on-disk cache."""
+    cache_path = _TRANSCRIPTS_CACHE_DIR / f"{video_id}.{lang}.txt"
+    cached = _read_cached_transcript(cache_path)
+    if cached:
+        return cached
+    text = _fetch_transcript_via_rapidapi(video_id, [lang])
+    if text:
+        try:
+            _TRANSCRIPTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".txt.tmp")
+            tmp_path.write_text(text, encoding="utf-8")
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            logger.warning("Failed to write transcript cache at %s", cache_path, exc_info=True)
+    return text
+
+
 def fetch_transcript_text(video_id: str, preferred_languages: Optional[list[str]] = None, max_chars: int = 8000, use_generated_fallback: bool = True) -> Optional[str]:
     langs = preferred_languages
     if langs is None:
@@ -266,7 +376,7 @@ def fetch_transcript_text(video_id: str, preferred_languages: Optional[list[str]
             langs = ["en"]
 
     for lang in langs:
-        text = _fetch_transcript_via_rapidapi(video_id, [lang])
+        text = _fetch_transcript_cached(video_id, lang)
         if text:
             text = " ".join(text.split())
             if len(text) > max_chars:
@@ -279,13 +389,22 @@ def parse_published_at_iso8601(ts: str) -> Optional[datetime]:
     if not ts:
         return None
     try:
-        # YouTube returns e.g. 2024-08-23T12:34:56Z
-        return datetime.fromisoformat(ts.replace("Z", "+00:00"))
+        # YouTube returns e.g. 2024-08-23T12:34:56Z; fromisoformat accepts the "Z" suffix on 3.11+
+        return datetime.fromisoformat(ts)
     except Exception:
         return None
 
 
-def check_for_new_video_and_get_transcript(
+@dataclass
+class ChannelScan:
+    """Outcome of scanning a channel: what was looked at and the chosen (video_id, transcript), if any."""
+
+    channel_id: Optional[str]
+    candidates: list[ChannelLatestVideo]
+    match: Optional[tuple[str, str]] = None
+
+
+def scan_channel_for_transcript(
     *,
     channel_handle_or_id: str,
     credentials_dir: Path,
@@ -293,15 +412,17 @@ def check_for_new_video_and_get_transcript(
     freshness_days: int = 1,
     max_candidates: int = 5,
     use_generated_fallback: bool = True,
-) -> Optional[tuple[str, str]]:
-    """If a video uploaded within the last N days (excluding today) has a transcript,
-    return (video_id, transcript). Checks up to max_candidates newest videos.
+) -> ChannelScan:
+    """Resolve the channel, list up to max_candidates newest uploads and pick the newest one
+    uploaded within the last N days (excluding today) that has a transcript.
     N is given by freshness_days (default 1 == "yesterday").
+    The returned scan carries the resolved channel id and candidate list so callers can
+    report on the search without repeating the RapidAPI lookups.
     """
     monitor = YouTubePublicMonitor(credentials_dir=credentials_dir)
     channel_id = monitor.resolve_channel_id(channel_handle_or_id)
     if not channel_id:
-        return None
+        return ChannelScan(channel_id=None, candidates=[])
 
     # Iterate over recent uploads to avoid missing cases where the newest has no transcript
     recent_videos = monitor.fetch_recent_videos(channel_id, max_results=max_candidates)
@@ -309,21 +430,57 @@ def check_for_new_video_and_get_transcript(
         # Fallback to single latest
         latest = monitor.fetch_latest_video(channel_id)
         recent_videos = [latest] if latest else []
+    scan = ChannelScan(channel_id=channel_id, candidates=recent_videos)
 
     now = datetime.now(timezone.utc)
     today_utc = now.date()
     allowed_dates = { (today_utc - timedelta(days=offset)) for offset in range(1, max(1, freshness_days) + 1) }
-    for vid in recent_videos:
-        if not vid or not vid.video_id:
-            continue
-        published_dt = parse_published_at_iso8601(vid.published_at)
-        if not published_dt:
-            continue
-        pub_date_utc = published_dt.astimezone(timezone.utc).date()
-        if pub_date_utc not in allowed_dates:
+    fresh_videos: list[ChannelLatestVideo] = [
+        vid
+        for vid in recent_videos
+        if vid
+        and vid.video_id
+        and (published_dt := parse_published_at_iso8601(vid.published_at))
+        and published_dt.astimezone(timezone.utc).date() in allowed_dates
+    ]
+    if not fresh_videos:
+        return scan
+
+    # Fetch all fresh candidates concurrently; keep newest-first precedence when picking the winner
+    transcripts = asyncio.run(
+        _fetch_transcripts_async(
+            [vid.video_id for vid in fresh_videos],
+            preferred_languages=preferred_languages,
+            use_generated_fallback=use_generated_fallback,
+        )
+    )
+    for vid, transcript in zip(fresh_videos, transcripts):
+        if isinstance(transcript, BaseException):
+            logger.warning("Transcript fetch failed for %s: %s", vid.video_id, transcript)
             continue
-        transcript = fetch_transcript_text(vid.video_id, preferred_languages=preferred_languages, use_generated_fallback=use_generated_fallback)
         if transcript:
-            return vid.video_id, transcript
+            scan.match = (vid.video_id, transcript)
+            break
+
+    return scan
+
+
+async def _fetch_transcripts_async(
+    video_ids: list[str],
+    *,
+    preferred_languages: Optional[list[str]],
+    use_generated_fallback: bool,
+    concurrency: int = 5,
+) -> list[Optional[str] | BaseException]:
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run_one(video_id: str) -> Optional[str]:
+        async with semaphore:
+            return await asyncio.to_thread(
+                fetch_transcript_text,
+                video_id,
+                preferred_languages=preferred_languages,
+                use_generated_fallback=use_generated_fallback,
+            )
 
-    return None
\ No newline at end of file
+    return await asyncio.gather(*(run_one(v) for v in video_ids), return_exceptions=True)
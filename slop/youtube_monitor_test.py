@@ -0,0 +1,83 @@
+import os
+import time
+
+import pytest
+
+from slop import youtube_monitor
+
+
+@pytest.fixture
+def transcripts_dir(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "transcripts"
+    monkeypatch.setattr(youtube_monitor, "_TRANSCRIPTS_CACHE_DIR", cache_dir)
+    return cache_dir
+
+
+@pytest.fixture
+def rapidapi_calls(monkeypatch):
+    calls = []
+
+    def fake_fetch(video_id, preferred_languages=None):
+        calls.append((video_id, preferred_languages))
+        return f"transcript of {video_id}"
+
+    monkeypatch.setattr(youtube_monitor, "_fetch_transcript_via_rapidapi", fake_fetch)
+    return calls
+
+
+def test_transcript_cache_miss_then_hit(transcripts_dir, rapidapi_calls):
+    assert youtube_monitor._fetch_transcript_cached("abc", "pl") == "transcript of abc"
+    assert (transcripts_dir / "abc.pl.txt").read_text(encoding="utf-8") == "transcript of abc"
+    assert youtube_monitor._fetch_transcript_cached("abc", "pl") == "transcript of abc"
+    assert rapidapi_calls == [("abc", ["pl"])]
+
+
+def test_transcript_cache_expires(transcripts_dir, rapidapi_calls):
+    transcripts_dir.mkdir()
+    cache_path = transcripts_dir / "abc.pl.txt"
+    cache_path.write_text("old transcript", encoding="utf-8")
+    stale = time.time() - youtube_monitor._TRANSCRIPT_CACHE_TTL_SECONDS - 60
+    os.utime(cache_path, (stale, stale))
+    assert youtube_monitor._fetch_transcript_cached("abc", "pl") == "transcript of abc"
+    assert cache_path.read_text(encoding="utf-8") == "transcript of abc"
+    assert len(rapidapi_calls) == 1
+
+
+def test_transcript_cache_corrupt_file_is_refetched(transcripts_dir, rapidapi_calls):
+    transcripts_dir.mkdir()
+    (transcripts_dir / "abc.pl.txt").write_bytes(b"\xff\xfe\x00broken")
+    assert youtube_monitor._fetch_transcript_cached("abc", "pl") == "transcript of abc"
+    assert len(rapidapi_calls) == 1
+
+
+@pytest.fixture
+def channels_cache(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(youtube_monitor, "_CACHE_DIR", cache_dir)
+    monkeypatch.setattr(youtube_monitor, "_CHANNELS_CACHE_PATH", cache_dir / "channels.json")
+    monkeypatch.setattr(youtube_monitor, "_CHANNEL_ID_MEMORY_CACHE", {})
+    return cache_dir
+
+
+def test_channel_cache_roundtrip(channels_cache):
+    youtube_monitor._write_cached_channel_id("@chan", "UC1234567890")
+    assert youtube_monitor._read_cached_channel_id("@chan") == "UC1234567890"
+    assert youtube_monitor._read_cached_channel_id("@other") is None
+
+
+def test_channel_cache_corrupt_json(channels_cache):
+    channels_cache.mkdir()
+    (channels_cache / "channels.json").write_text("{not json", encoding="utf-8")
+    assert youtube_monitor._load_channels_cache() == {}
+    assert youtube_monitor._read_cached_channel_id("@chan") is None
+    youtube_monitor._write_cached_channel_id("@chan", "UC1234567890")
+    assert youtube_monitor._read_cached_channel_id("@chan") == "UC1234567890"
+
+
+def test_channel_cache_unwritable_dir_does_not_break_resolution(channels_cache, tmp_path, monkeypatch):
+    # A regular file where the cache directory should be makes mkdir fail, even as root
+    channels_cache.write_text("", encoding="utf-8")
+    monitor = youtube_monitor.YouTubePublicMonitor(tmp_path)
+    monkeypatch.setattr(monitor, "_resolve_channel_id_remote", lambda handle: "UC1234567890")
+    assert monitor.resolve_channel_id("@Chan") == "UC1234567890"
+    assert youtube_monitor._CHANNEL_ID_MEMORY_CACHE == {"@chan": "UC1234567890"}
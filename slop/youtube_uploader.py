@@ -22,7 +22,13 @@ YOUTUBE_UPLOAD_SCOPES = [
 ]
 
 
-@dataclass
+# Validated credentials keyed by token path; uploaders created for the same
+# credentials directory within one process skip re-reading and re-checking the token
+# until it expires or the token file is replaced (mtime changes).
+_CREDENTIALS_CACHE: dict[Path, tuple[Optional[int], Credentials]] = {}
+
+
+@dataclass(slots=True, frozen=True)
 class UploadMetadata:
     title: str
     description: str = ""
@@ -39,6 +45,7 @@ class YouTubeUploader:
         # Use a dedicated token file for YouTube
         self.token_path = self.credentials_dir / "youtube_token.json"
         self._config = config
+        self._service = None
 
     def _materialize_oauth_files_from_config_or_env(self) -> None:
         """Write client_secret.json and youtube_token.json from AppConfig if provided.
@@ -69,6 +76,10 @@ class YouTubeUploader:
                 pass
 
     def _get_credentials(self) -> Credentials:
+        cached = _CREDENTIALS_CACHE.get(self.token_path)
+        if cached is not None and cached[1].valid and cached[0] == _mtime_ns(self.token_path):
+            return cached[1]
+
         # Attempt to materialize OAuth files from AppConfig/env before reading
         self._materialize_oauth_files_from_config_or_env()
 
@@ -123,6 +134,7 @@ class YouTubeUploader:
                 f"Required: {', '.join(required_scopes)} | Present: {', '.join(sorted(existing_scopes))}. "
                 "Generate a new token with the required scopes."
             )
+        _CREDENTIALS_CACHE[self.token_path] = (_mtime_ns(self.token_path), creds)
         return creds
 
     def authorize(self) -> Path:
@@ -136,10 +148,14 @@ class YouTubeUploader:
         return self.token_path
 
     def _build_service(self):
-        creds = self._get_credentials()
-        return build("youtube", "v3", credentials=creds)
-
-    def upload_video(self, video_path: Path, metadata: UploadMetadata) -> str:
+        # Build the API client once per uploader so repeated uploads reuse its HTTP connection
+        if self._service is None:
+            creds = self._get_credentials()
+            self._service = build("youtube", "v3", credentials=creds)
+        return self._service
+
+    def upload_video(self, video_path: Path, metadata: UploadMetadata, *, chunk_size: int = 1024 * 1024 * 8) -> str:
+        """Upload a video with a resumable request; chunk_size=-1 sends the whole file in one request."""
         youtube = self._build_service()
 
         mime_type, _ = mimetypes.guess_type(video_path)
@@ -149,7 +165,7 @@ class YouTubeUploader:
         media = MediaFileUpload(
             filename=str(video_path),
             mimetype=mime_type,
-            chunksize=1024 * 1024 * 8,  # 8MB chunks
+            chunksize=chunk_size,
             resumable=True,
         )
 
@@ -211,3 +227,8 @@ class YouTubeUploader:
         youtube.thumbnails().set(videoId=video_id, media_body=media).execute()
 
 
+def _mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None